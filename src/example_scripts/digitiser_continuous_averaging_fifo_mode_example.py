@@ -71,13 +71,13 @@ def continuous_averaging_multi_fifo_example(
         card.execute_continuous_fifo_acquisition()
         start_time = monotonic()
         # Retrieve streamed waveform data until desired time has elapsed
-        measurements_list = []
+        measurements_list: List[Measurement] = []
         while (monotonic() - start_time) < acquisition_duration_in_seconds:
             print(f"Asking for waveforms at {monotonic() - start_time}")
-            measurements_list += [
+            measurements_list.extend(
                 Measurement(waveforms=frame, timestamp=card.get_timestamp()) for frame in card.get_waveforms()
-            ]
-            print(f"got {measurements_list} measurements")
+            )
+            print(f"got {len(measurements_list)} measurements")
             if measurements_list[-1].timestamp is not None:
                 print(
                     f"Got measurement triggered at {measurements_list[-1].timestamp.time()} (acquisition latency of"
@@ -72,12 +72,12 @@ def continuous_multi_fifo_example(
         card.execute_continuous_fifo_acquisition()
 
         # Retrieve streamed waveform data until desired time has elapsed
-        measurements_list = []
+        measurements_list: List[Measurement] = []
         while (monotonic() - start_time) < time_to_keep_acquiring_for_in_seconds:
 
-            measurements_list += [
+            measurements_list.extend(
                 Measurement(waveforms=frame, timestamp=card.get_timestamp()) for frame in card.get_waveforms()
-            ]
+            )
 
             if measurements_list[-1].timestamp is not None:
                 print(
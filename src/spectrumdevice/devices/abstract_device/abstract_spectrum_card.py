@@ -7,14 +7,15 @@ Hubs, which are aggregates of multiple cards)."""
 
 import logging
 from abc import ABC, abstractmethod
-from functools import reduce
-from operator import or_
-from typing import Any, List, Optional, Sequence, Tuple
+from time import perf_counter_ns, sleep
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from spectrum_gmbh.py_header.regs import (
     M2CMD_DATA_STARTDMA,
     M2CMD_DATA_STOPDMA,
     M2CMD_DATA_WAITDMA,
+    M2STAT_DATA_BLOCKREADY,
+    M2STAT_DATA_END,
     SPCM_X0_AVAILMODES,
     SPCM_X1_AVAILMODES,
     SPCM_X2_AVAILMODES,
@@ -40,18 +41,21 @@ from spectrumdevice.exceptions import (
     SpectrumExternalTriggerNotEnabled,
     SpectrumInvalidNumberOfEnabledChannels,
     SpectrumNoTransferBufferDefined,
+    SpectrumStatusPollingTimeout,
     SpectrumTriggerOperationNotImplemented,
 )
 from spectrumdevice.settings import (
     AdvancedCardFeature,
     AvailableIOModes,
     CardFeature,
+    DEFAULT_HYBRID_WAIT_SPIN_TIME_IN_US,
     ModelNumber,
     DEVICE_STATUS_TYPE,
     ExternalTriggerMode,
     SpectrumRegisterLength,
     TransferBuffer,
     TriggerSource,
+    WaitStrategy,
 )
 from spectrumdevice.settings.card_dependent_properties import CardType
 from spectrumdevice.settings.card_features import decode_advanced_card_features, decode_card_features
@@ -68,6 +72,16 @@ from spectrumdevice.spectrum_wrapper import destroy_handle
 
 logger = logging.getLogger(__name__)
 
+# Enum .value lookups are comparatively slow, so the trigger source mask values are looked up from a dict instead
+_TRIGGER_SOURCE_VALUES = {source: source.value for source in TriggerSource}
+# Likewise, register values are converted to Enum members using dicts. Unrecognised values fall back to the Enum
+# constructor, which raises the usual ValueError.
+_CARD_TYPES_BY_VALUE = {card_type.value: card_type for card_type in CardType}
+_CLOCK_MODES_BY_VALUE = {mode.value: mode for mode in ClockMode}
+_EXTERNAL_TRIGGER_MODES_BY_VALUE = {mode.value: mode for mode in ExternalTriggerMode}
+_EXTERNAL_TRIGGER_SOURCE_VALUES = frozenset(EXTERNAL_TRIGGER_MODE_COMMANDS.keys())
+_VALID_NUMBERS_OF_ENABLED_CHANNELS = frozenset((1, 2, 4, 8))
+
 
 # Use a Generic and Type Variables to allow subclasses of AbstractSpectrumCard to define whether they own AWG analog
 # channels or Digitiser analog channels and IO lines
@@ -88,10 +102,17 @@ class AbstractSpectrumCard(AbstractSpectrumDevice[AnalogChannelInterfaceType, IO
             self._visa_string = _create_visa_string_from_ip(ip_address, device_number)
         else:
             self._visa_string = f"/dev/spcm{device_number}"
+        self._register_cache: Dict[int, int] = {}
+        self._wait_strategy = WaitStrategy.INTERRUPT
+        self._hybrid_wait_spin_time_in_ns = DEFAULT_HYBRID_WAIT_SPIN_TIME_IN_US * 1000
         self._connect(self._visa_string)
         self._model_number = ModelNumber(self.read_spectrum_device_register(SPC_PCITYP))
         self._trigger_sources: List[TriggerSource] = []
+        self._or_of_trigger_sources: Optional[int] = None
+        self._active_external_trigger_sources: List[TriggerSource] = []
         self._analog_channels = self._init_analog_channels()
+        # channel names never change, so their SPC_CHENABLE bits are looked up once, indexed by channel number
+        self._analog_channel_enable_bits = tuple(channel.name.value for channel in self._analog_channels)
         self._io_lines = self._init_io_lines()
         self._enabled_analog_channels: List[int] = [0]
         self._transfer_buffer: Optional[TransferBuffer] = None
@@ -104,6 +125,74 @@ class AbstractSpectrumCard(AbstractSpectrumDevice[AnalogChannelInterfaceType, IO
     def reconnect(self) -> None:
         """Reconnect to the card after disconnect() has been called."""
         self._connect(self._visa_string)
+        self.refresh_cached_registers()
+
+    def reset(self) -> None:
+        """Perform a software and hardware reset. See `AbstractSpectrumDevice.reset()` for more information."""
+        super().reset()
+        self.refresh_cached_registers()
+
+    def refresh_cached_registers(self) -> None:
+        """Discard the cached values of the settings that are only changed by their setter methods (e.g. the acquisition
+        mode and sample rate), so that they are read from the card again the next time they are accessed. Writes made
+        through this object, including using `write_to_spectrum_device_register()`, keep the cache up to date. Call this
+        if the card's registers may have been changed by other means, for example by another process."""
+        self._register_cache.clear()
+
+    def write_to_spectrum_device_register(
+        self,
+        spectrum_register: int,
+        value: int,
+        length: SpectrumRegisterLength = SpectrumRegisterLength.THIRTY_TWO,
+    ) -> None:
+        """Set the value of a register on the card. See `AbstractSpectrumDevice.write_to_spectrum_device_register()`.
+        Any cached value of the register is discarded, so that the setters and properties of this class see the new
+        value."""
+        try:
+            super().write_to_spectrum_device_register(spectrum_register, value, length)
+        finally:
+            self._discard_cached_registers((spectrum_register,))
+
+    def write_to_spectrum_device_registers(
+        self,
+        register_values: Sequence[Tuple[int, int]],
+        length: SpectrumRegisterLength = SpectrumRegisterLength.THIRTY_TWO,
+    ) -> None:
+        """Set the values of several registers on the card. See
+        `AbstractSpectrumDevice.write_to_spectrum_device_registers()`. Any cached values of the registers are discarded,
+        so that the setters and properties of this class see the new values."""
+        try:
+            super().write_to_spectrum_device_registers(register_values, length)
+        finally:
+            self._discard_cached_registers(register for register, _ in register_values)
+
+    def _discard_cached_registers(self, spectrum_registers: Iterable[int]) -> None:
+        """Discards the cached values of registers which have been written, because the driver may have coerced the
+        values written, so the next read must come from the card."""
+        for spectrum_register in spectrum_registers:
+            self._register_cache.pop(spectrum_register, None)
+
+    def _read_cached_register(
+        self, spectrum_register: int, length: SpectrumRegisterLength = SpectrumRegisterLength.THIRTY_TWO
+    ) -> int:
+        """Reads a register from the card the first time it is accessed after being set, then returns the cached value
+        until the corresponding setter is called again. Setters discard the cached value rather than storing the value
+        they wrote, because the driver may coerce it."""
+        try:
+            return self._register_cache[spectrum_register]
+        except KeyError:
+            value = self.read_spectrum_device_register(spectrum_register, length)
+            self._register_cache[spectrum_register] = value
+            return value
+
+    def _write_to_cached_register(
+        self, spectrum_register: int, value: int, length: SpectrumRegisterLength = SpectrumRegisterLength.THIRTY_TWO
+    ) -> None:
+        """Writes a register read using `_read_cached_register()`, unless its cached value shows that the card already
+        holds the value, in which case the write would have no effect. Otherwise, the cached value is discarded by
+        `write_to_spectrum_device_register()`."""
+        if self._register_cache.get(spectrum_register) != value:
+            self.write_to_spectrum_device_register(spectrum_register, value, length)
 
     @property
     def status(self) -> DEVICE_STATUS_TYPE:
@@ -162,7 +251,58 @@ class AbstractSpectrumCard(AbstractSpectrumDevice[AnalogChannelInterfaceType, IO
         # todo: update the above docstring to take into account cases where notify size < data lemgth
         # todo: docstring for AWG
         """
-        self.write_to_spectrum_device_register(SPC_M2CMD, M2CMD_DATA_WAITDMA)
+        self._wait_for_status(M2STAT_DATA_BLOCKREADY | M2STAT_DATA_END, M2CMD_DATA_WAITDMA)
+
+    @property
+    def wait_strategy(self) -> WaitStrategy:
+        """How the card waits for acquisitions and transfers to complete. See `WaitStrategy`.
+
+        Returns:
+            strategy (`WaitStrategy`): The current wait strategy.
+        """
+        return self._wait_strategy
+
+    def set_wait_strategy(
+        self, strategy: WaitStrategy, hybrid_spin_time_in_us: int = DEFAULT_HYBRID_WAIT_SPIN_TIME_IN_US
+    ) -> None:
+        """Change how the card waits for acquisitions and transfers to complete. Polling avoids the interrupt and
+        context switch latency of the blocking driver commands, which can be significant compared to the time between
+        triggers at high trigger rates, but keeps a CPU core busy while waiting. See `WaitStrategy`.
+
+        Args:
+            strategy (`WaitStrategy`): The desired wait strategy.
+            hybrid_spin_time_in_us (int): For `WaitStrategy.HYBRID`, the time for which to poll before falling back to
+                the blocking driver command. 0 disables polling, so the blocking driver command is issued immediately.
+
+        Raises:
+            ValueError: If hybrid_spin_time_in_us is negative.
+        """
+        if hybrid_spin_time_in_us < 0:
+            raise ValueError(f"Hybrid wait spin time must not be negative, but {hybrid_spin_time_in_us} us was given.")
+        self._wait_strategy = strategy
+        self._hybrid_wait_spin_time_in_ns = hybrid_spin_time_in_us * 1000
+
+    def _wait_for_status(self, status_mask: int, blocking_command: int) -> None:
+        """Waits until any of the bits in status_mask are set in the card status register, according to the current
+        wait strategy. blocking_command is the driver command which waits for the same status. In POLL mode,
+        `SpectrumStatusPollingTimeout` is raised if the card timeout elapses first, rather than issuing the blocking
+        command, which would wait for the timeout again."""
+        if self._wait_strategy is not WaitStrategy.INTERRUPT:
+            polling = self._wait_strategy is WaitStrategy.POLL
+            if polling:
+                spin_time_in_ns = self.timeout_in_ms * 1_000_000
+            else:
+                spin_time_in_ns = self._hybrid_wait_spin_time_in_ns
+            # only a POLL timeout of 0 means wait indefinitely. A HYBRID spin time of 0 goes straight to blocking_command
+            spin_indefinitely = polling and spin_time_in_ns == 0
+            deadline = perf_counter_ns() + spin_time_in_ns
+            while spin_indefinitely or perf_counter_ns() < deadline:
+                if self.read_spectrum_device_register(SPC_M2STATUS) & status_mask:
+                    return
+                sleep(0)  # yield to other threads (e.g. those waiting on other cards of a StarHub) between polls
+            if polling:
+                raise SpectrumStatusPollingTimeout(f"{self} did not reach the awaited status within its timeout.")
+        self.write_to_spectrum_device_register(SPC_M2CMD, blocking_command)
 
     @property
     def transfer_buffers(self) -> List[TransferBuffer]:
@@ -184,6 +324,7 @@ class AbstractSpectrumCard(AbstractSpectrumDevice[AnalogChannelInterfaceType, IO
         if self.connected:
             destroy_handle(self._handle)
             self._connected = False
+            self.refresh_cached_registers()
 
     @property
     def connected(self) -> bool:
@@ -236,7 +377,7 @@ class AbstractSpectrumCard(AbstractSpectrumDevice[AnalogChannelInterfaceType, IO
         Args:
             channels_nums (List[int]): The integer channel indices to enable.
         """
-        if len(channels_nums) in [1, 2, 4, 8]:
+        if len(channels_nums) in _VALID_NUMBERS_OF_ENABLED_CHANNELS:
             self._enabled_analog_channels = channels_nums
             self.apply_channel_enabling()
         else:
@@ -250,8 +391,12 @@ class AbstractSpectrumCard(AbstractSpectrumDevice[AnalogChannelInterfaceType, IO
             sources (List[`TriggerSource`]): A list of TriggerSources.
         """
         or_of_sources = self.read_spectrum_device_register(SPC_TRIG_ORMASK)
-        self._trigger_sources = decode_trigger_sources(or_of_sources)
-        return self._trigger_sources
+        if or_of_sources != self._or_of_trigger_sources:
+            # only decode the mask if it has changed since it was last read or set
+            self._trigger_sources = decode_trigger_sources(or_of_sources)
+            self._or_of_trigger_sources = or_of_sources
+            self._active_external_trigger_sources = _find_external_trigger_sources(self._trigger_sources)
+        return list(self._trigger_sources)  # a copy, so that callers cannot modify the cached sources
 
     def set_trigger_sources(self, sources: List[TriggerSource]) -> None:
         """Change the enabled trigger sources.
@@ -259,10 +404,13 @@ class AbstractSpectrumCard(AbstractSpectrumDevice[AnalogChannelInterfaceType, IO
         Args:
             sources (List[`TriggerSource`]): The TriggerSources to enable.
         """
-        self._trigger_sources = sources
-        or_of_sources = reduce(or_, [s.value for s in sources])
-        self.write_to_spectrum_device_register(SPC_TRIG_ORMASK, or_of_sources)
-        self.write_to_spectrum_device_register(SPC_TRIG_ANDMASK, 0)
+        or_of_sources = 0
+        for source in sources:
+            or_of_sources |= _TRIGGER_SOURCE_VALUES[source]
+        self.write_to_spectrum_device_registers([(SPC_TRIG_ORMASK, or_of_sources), (SPC_TRIG_ANDMASK, 0)])
+        self._trigger_sources = list(sources)
+        self._active_external_trigger_sources = _find_external_trigger_sources(sources)
+        self._or_of_trigger_sources = None  # decode from the register on the next read, as the driver may coerce it
 
     @property
     def external_trigger_mode(self) -> ExternalTriggerMode:
@@ -275,9 +423,8 @@ class AbstractSpectrumCard(AbstractSpectrumDevice[AnalogChannelInterfaceType, IO
         else:
             first_trig_source = self._active_external_triggers[0]
             try:
-                return ExternalTriggerMode(
-                    self.read_spectrum_device_register(EXTERNAL_TRIGGER_MODE_COMMANDS[first_trig_source.value])
-                )
+                mode_value = self.read_spectrum_device_register(EXTERNAL_TRIGGER_MODE_COMMANDS[first_trig_source.value])
+                return _EXTERNAL_TRIGGER_MODES_BY_VALUE.get(mode_value) or ExternalTriggerMode(mode_value)
             except KeyError:
                 raise SpectrumTriggerOperationNotImplemented(f"Cannot get trigger mode of {first_trig_source.name}.")
 
@@ -300,12 +447,8 @@ class AbstractSpectrumCard(AbstractSpectrumDevice[AnalogChannelInterfaceType, IO
 
     @property
     def _active_external_triggers(self) -> List[TriggerSource]:
-        return [
-            TriggerSource(val)
-            for val in list(
-                set(EXTERNAL_TRIGGER_MODE_COMMANDS.keys()) & set([source.value for source in self._trigger_sources])
-            )
-        ]
+        # kept up to date whenever the trigger sources are set or decoded, rather than recalculated on every access
+        return self._active_external_trigger_sources
 
     @property
     def external_trigger_level_in_mv(self) -> int:
@@ -381,14 +524,15 @@ class AbstractSpectrumCard(AbstractSpectrumDevice[AnalogChannelInterfaceType, IO
     def apply_channel_enabling(self) -> None:
         """Apply the enabled channels chosen using set_enable_channels(). This happens automatically and does not
         usually need to be called."""
-        enabled_channel_spectrum_values = [self.analog_channels[i].name.value for i in self._enabled_analog_channels]
-        if len(enabled_channel_spectrum_values) in [1, 2, 4, 8]:
-            bitwise_or_of_enabled_channels = reduce(or_, enabled_channel_spectrum_values)
+        num_enabled_channels = len(self._enabled_analog_channels)
+        if num_enabled_channels in _VALID_NUMBERS_OF_ENABLED_CHANNELS:
+            channel_enable_bits = self._analog_channel_enable_bits
+            bitwise_or_of_enabled_channels = 0
+            for channel_num in self._enabled_analog_channels:
+                bitwise_or_of_enabled_channels |= channel_enable_bits[channel_num]
             self.write_to_spectrum_device_register(SPC_CHENABLE, bitwise_or_of_enabled_channels)
         else:
-            raise SpectrumInvalidNumberOfEnabledChannels(
-                f"Cannot enable {len(enabled_channel_spectrum_values)} " f"channels on one card."
-            )
+            raise SpectrumInvalidNumberOfEnabledChannels(f"Cannot enable {num_enabled_channels} channels on one card.")
 
     @abstractmethod
     def _init_analog_channels(self) -> Sequence[AnalogChannelInterfaceType]:
@@ -406,7 +550,7 @@ class AbstractSpectrumCard(AbstractSpectrumDevice[AnalogChannelInterfaceType, IO
         Returns:
             timeout_in_ms (in)t: The currently set timeout in ms.
         """
-        return self.read_spectrum_device_register(SPC_TIMEOUT)
+        return self._read_cached_register(SPC_TIMEOUT)
 
     def set_timeout_in_ms(self, timeout_in_ms: int) -> None:
         """Change the time for which the card will wait for a trigger to tbe received after the device has started
@@ -415,7 +559,7 @@ class AbstractSpectrumCard(AbstractSpectrumDevice[AnalogChannelInterfaceType, IO
         Args:
             timeout_in_ms (int): The desired timeout in ms.
         """
-        self.write_to_spectrum_device_register(SPC_TIMEOUT, timeout_in_ms)
+        self._write_to_cached_register(SPC_TIMEOUT, timeout_in_ms)
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -424,7 +568,8 @@ class AbstractSpectrumCard(AbstractSpectrumDevice[AnalogChannelInterfaceType, IO
         Returns:
             mode (`ClockMode`): The currently set clock mode.
         """
-        return ClockMode(self.read_spectrum_device_register(SPC_CLOCKMODE))
+        mode_value = self._read_cached_register(SPC_CLOCKMODE)
+        return _CLOCK_MODES_BY_VALUE.get(mode_value) or ClockMode(mode_value)
 
     def set_clock_mode(self, mode: ClockMode) -> None:
         """Change the clock mode. See `ClockMode` and the Spectrum documentation for available modes.
@@ -432,7 +577,9 @@ class AbstractSpectrumCard(AbstractSpectrumDevice[AnalogChannelInterfaceType, IO
         Args:
             mode (`ClockMode`): The desired clock mode.
         """
-        self.write_to_spectrum_device_register(SPC_CLOCKMODE, mode.value)
+        self._write_to_cached_register(SPC_CLOCKMODE, mode.value)
+        # the card may adjust its sample rate to suit the new clock, so the cached sample rate can no longer be trusted
+        self._register_cache.pop(SPC_SAMPLERATE, None)
 
     @property
     def available_io_modes(self) -> AvailableIOModes:
@@ -441,11 +588,14 @@ class AbstractSpectrumCard(AbstractSpectrumDevice[AnalogChannelInterfaceType, IO
 
         Returns:
             modes (`AvailableIOModes`): An `AvailableIOModes` dataclass containing the modes for each IO line."""
+        x0_modes, x1_modes, x2_modes, x3_modes = self.read_spectrum_device_registers(
+            [SPCM_X0_AVAILMODES, SPCM_X1_AVAILMODES, SPCM_X2_AVAILMODES, SPCM_X3_AVAILMODES]
+        )
         return AvailableIOModes(
-            X0=decode_available_io_modes(self.read_spectrum_device_register(SPCM_X0_AVAILMODES)),
-            X1=decode_available_io_modes(self.read_spectrum_device_register(SPCM_X1_AVAILMODES)),
-            X2=decode_available_io_modes(self.read_spectrum_device_register(SPCM_X2_AVAILMODES)),
-            X3=decode_available_io_modes(self.read_spectrum_device_register(SPCM_X3_AVAILMODES)),
+            X0=decode_available_io_modes(x0_modes),
+            X1=decode_available_io_modes(x1_modes),
+            X2=decode_available_io_modes(x2_modes),
+            X3=decode_available_io_modes(x3_modes),
         )
 
     @property
@@ -457,9 +607,8 @@ class AbstractSpectrumCard(AbstractSpectrumDevice[AnalogChannelInterfaceType, IO
             features (List[Tuple[List[`CardFeature`], List[`AdvancedCardFeature`]]]): A tuple of two lists - of features
                 and advanced features respectively - wrapped in a list.
         """
-        normal_features = decode_card_features(self.read_spectrum_device_register(SPC_PCIFEATURES))
-        advanced_features = decode_advanced_card_features(self.read_spectrum_device_register(SPC_PCIEXTFEATURES))
-        return [(normal_features, advanced_features)]
+        features, advanced_features = self.read_spectrum_device_registers([SPC_PCIFEATURES, SPC_PCIEXTFEATURES])
+        return [(decode_card_features(features), decode_advanced_card_features(advanced_features))]
 
     @property
     def sample_rate_in_hz(self) -> int:
@@ -468,21 +617,22 @@ class AbstractSpectrumCard(AbstractSpectrumDevice[AnalogChannelInterfaceType, IO
         Returns:
             rate (int): The currently set sample rate in Hz.
         """
-        return self.read_spectrum_device_register(SPC_SAMPLERATE, SpectrumRegisterLength.SIXTY_FOUR)
+        return self._read_cached_register(SPC_SAMPLERATE, SpectrumRegisterLength.SIXTY_FOUR)
 
     def set_sample_rate_in_hz(self, rate: int) -> None:
         """Change the rate at which samples will be acquired or generated, in Hz.
         Args:
             rate (int): The desired sample rate in Hz.
         """
-        self.write_to_spectrum_device_register(SPC_SAMPLERATE, rate, SpectrumRegisterLength.SIXTY_FOUR)
+        self._write_to_cached_register(SPC_SAMPLERATE, rate, SpectrumRegisterLength.SIXTY_FOUR)
 
     def __str__(self) -> str:
         return f"Card {self._visa_string} (model {self.model_number.name})."
 
     @property
     def type(self) -> CardType:
-        return CardType(self.read_spectrum_device_register(SPC_FNCTYPE))
+        type_value = self.read_spectrum_device_register(SPC_FNCTYPE)
+        return _CARD_TYPES_BY_VALUE.get(type_value) or CardType(type_value)
 
     def force_trigger(self) -> None:
         """Force a trigger event to occur"""
@@ -490,7 +640,12 @@ class AbstractSpectrumCard(AbstractSpectrumDevice[AnalogChannelInterfaceType, IO
 
     @property
     def bytes_per_sample(self) -> int:
-        return self.read_spectrum_device_register(SPC_MIINST_BYTESPERSAMPLE)
+        # a fixed property of the card's ADCs or DACs, so it only needs to be read once
+        return self._read_cached_register(SPC_MIINST_BYTESPERSAMPLE)
+
+
+def _find_external_trigger_sources(sources: List[TriggerSource]) -> List[TriggerSource]:
+    return list(dict.fromkeys(s for s in sources if _TRIGGER_SOURCE_VALUES[s] in _EXTERNAL_TRIGGER_SOURCE_VALUES))
 
 
 def _create_visa_string_from_ip(ip_address: str, instrument_number: int) -> str:
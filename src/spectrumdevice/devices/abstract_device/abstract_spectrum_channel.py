@@ -1,6 +1,6 @@
 """Provides a partially-implemented abstract class common to individual channels of Spectrum devices."""
 from abc import abstractmethod, ABC
-from typing import Any, TypeVar, Generic
+from typing import Any, Generic, Optional, TypeVar
 
 # Christian Baker, King's College London
 # Copyright (c) 2024 School of Biomedical Engineering & Imaging Sciences, King's College London
@@ -16,6 +16,9 @@ from spectrumdevice.settings.channel import SpectrumAnalogChannelName, SpectrumC
 
 
 ChannelNameType = TypeVar("ChannelNameType", bound=SpectrumChannelName)
+# analog channel names, keyed by channel number. A dict rather than a sequence, so that invalid (including negative)
+# numbers raise KeyError
+_ANALOG_CHANNEL_NAMES = {n: SpectrumAnalogChannelName[f"CHANNEL{n}"] for n in range(len(SpectrumAnalogChannelName))}
 
 
 class AbstractSpectrumChannel(SpectrumChannelInterface, Generic[ChannelNameType]):
@@ -25,8 +28,10 @@ class AbstractSpectrumChannel(SpectrumChannelInterface, Generic[ChannelNameType]
     def __init__(self, channel_number: int, parent_device: SpectrumDeviceInterface, **kwargs: Any) -> None:
         super().__init__(**kwargs)
         self._name = self._make_name(channel_number)
+        self._channel_number = channel_number
         self._parent_device = parent_device
         self._enabled = True
+        self._str: Optional[str] = None  # built on first use, as neither the name nor the parent device change
 
     @property
     @abstractmethod
@@ -47,7 +52,7 @@ class AbstractSpectrumChannel(SpectrumChannelInterface, Generic[ChannelNameType]
 
     @property
     def _number(self) -> int:
-        return int(self.name.name.split(self._name_prefix)[-1])
+        return self._channel_number
 
     def write_to_parent_device_register(
         self,
@@ -66,12 +71,22 @@ class AbstractSpectrumChannel(SpectrumChannelInterface, Generic[ChannelNameType]
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, AbstractSpectrumChannel):
-            return (self.name == other.name) and (self._parent_device == other._parent_device)
+            return (self._name == other._name) and (
+                self._parent_device is other._parent_device or self._parent_device == other._parent_device
+            )
         else:
-            raise NotImplementedError()
+            # channels hash like their names, so they can share sets and dicts with other objects, which are not equal
+            return NotImplemented
+
+    def __hash__(self) -> int:
+        # Equal channels have equal names, so hashing the name alone is consistent with __eq__. The parent device is
+        # not hashed, as it is compared using its handle, which changes if the device is reconnected.
+        return hash(self._name)
 
     def __str__(self) -> str:
-        return f"{self._name.name} of {self._parent_device}"
+        if self._str is None:
+            self._str = f"{self._name.name} of {self._parent_device}"
+        return self._str
 
     def __repr__(self) -> str:
         return str(self)
@@ -88,4 +103,4 @@ class AbstractSpectrumAnalogChannel(
         return "CHANNEL"
 
     def _make_name(self, channel_number: int) -> SpectrumAnalogChannelName:
-        return SpectrumAnalogChannelName[f"{self._name_prefix}{channel_number}"]
+        return _ANALOG_CHANNEL_NAMES[channel_number]
@@ -6,6 +6,7 @@
 
 from abc import ABC
 from copy import copy
+from typing import List, Sequence, Tuple
 
 from spectrumdevice.devices.abstract_device.device_interface import (
     SpectrumDeviceInterface,
@@ -38,6 +39,17 @@ from spectrumdevice.spectrum_wrapper import (
     spectrum_handle_factory,
 )
 
+# API functions for accessing registers of each length
+_REGISTER_SETTERS = {
+    SpectrumRegisterLength.THIRTY_TWO: set_spectrum_i32_api_param,
+    SpectrumRegisterLength.SIXTY_FOUR: set_spectrum_i64_api_param,
+}
+_REGISTER_GETTERS = {
+    SpectrumRegisterLength.THIRTY_TWO: get_spectrum_i32_api_param,
+    SpectrumRegisterLength.SIXTY_FOUR: get_spectrum_i64_api_param,
+}
+_EXTERNAL_TRIGGER_SOURCES = frozenset(EXTERNAL_TRIGGER_SOURCES)
+
 
 class AbstractSpectrumDevice(SpectrumDeviceInterface[AnalogChannelInterfaceType, IOLineInterfaceType], ABC):
     """Abstract superclass which implements methods common to all Spectrum devices. Instances of this class
@@ -47,7 +59,7 @@ class AbstractSpectrumDevice(SpectrumDeviceInterface[AnalogChannelInterfaceType,
 
     def _connect(self, visa_string: str) -> None:
         self._handle = spectrum_handle_factory(visa_string)
-        self._connected = True
+        self._connected = True  # read directly by the register access methods, which are called very frequently
 
     def reset(self) -> None:
         """Perform a software and hardware reset.
@@ -87,7 +99,7 @@ class AbstractSpectrumDevice(SpectrumDeviceInterface[AnalogChannelInterfaceType,
         Args:
             settings (`TriggerSettings`): A `TriggerSettings` dataclass containing the setting values to apply."""
         self.set_trigger_sources(settings.trigger_sources)
-        if len(set(self.trigger_sources) & set(EXTERNAL_TRIGGER_SOURCES)) > 0:
+        if any(source in _EXTERNAL_TRIGGER_SOURCES for source in self.trigger_sources):
             if settings.external_trigger_mode is not None:
                 self.set_external_trigger_mode(settings.external_trigger_mode)
             if settings.external_trigger_level_in_mv is not None:
@@ -162,13 +174,45 @@ class AbstractSpectrumDevice(SpectrumDeviceInterface[AnalogChannelInterfaceType,
                 "Cannot communicate with hardware. For testing on a system without drivers or connected hardware, use"
                 " MockSpectrumDigitiserCard instead."
             )
-        if self.connected:
-            if length == SpectrumRegisterLength.THIRTY_TWO:
-                set_spectrum_i32_api_param(self._handle, spectrum_register, value)
-            elif length == SpectrumRegisterLength.SIXTY_FOUR:
-                set_spectrum_i64_api_param(self._handle, spectrum_register, value)
-            else:
+        if self._connected:
+            try:
+                set_param = _REGISTER_SETTERS[length]
+            except KeyError:
+                raise ValueError("Spectrum integer length not recognised.")
+            set_param(self._handle, spectrum_register, value)
+        else:
+            raise SpectrumDeviceNotConnected("The device has been disconnected.")
+
+    def write_to_spectrum_device_registers(
+        self,
+        register_values: Sequence[Tuple[int, int]],
+        length: SpectrumRegisterLength = SpectrumRegisterLength.THIRTY_TWO,
+    ) -> None:
+        """Set the values of several registers of the same length on the Spectrum device in one go.
+
+        The driver and connection checks, and the choice of 32 or 64-bit API function, are made once for the whole
+        sequence rather than once per register, so this is preferable to repeated calls to
+        `write_to_spectrum_device_register()` when configuring several registers at once. Registers are written in the
+        order given.
+
+        Args:
+            register_values (Sequence[Tuple[int, int]]): (register, value) pairs to write. Registers should be global
+                constants imported from regs.py in the spectrum_gmbh package.
+            length (`SpectrumRegisterLength`): A `SpectrumRegisterLength` object specifying the length of all of the
+                registers to set, in bits.
+        """
+        if not SPECTRUM_DRIVERS_FOUND:
+            raise SpectrumDriversNotFound(
+                "Cannot communicate with hardware. For testing on a system without drivers or connected hardware, use"
+                " MockSpectrumDigitiserCard instead."
+            )
+        if self._connected:
+            try:
+                set_param = _REGISTER_SETTERS[length]
+            except KeyError:
                 raise ValueError("Spectrum integer length not recognised.")
+            for spectrum_register, value in register_values:
+                set_param(self._handle, spectrum_register, value)
         else:
             raise SpectrumDeviceNotConnected("The device has been disconnected.")
 
@@ -198,13 +242,46 @@ class AbstractSpectrumDevice(SpectrumDeviceInterface[AnalogChannelInterfaceType,
                 "Cannot communicate with hardware. For testing on a system without drivers or connected hardware, use"
                 " a mock device instead (e.g. MockSpectrumDigitiserCard or MockSpectrumStarHub)."
             )
-        if self.connected:
-            if length == SpectrumRegisterLength.THIRTY_TWO:
-                return get_spectrum_i32_api_param(self._handle, spectrum_register)
-            elif length == SpectrumRegisterLength.SIXTY_FOUR:
-                return get_spectrum_i64_api_param(self._handle, spectrum_register)
-            else:
+        if self._connected:
+            try:
+                get_param = _REGISTER_GETTERS[length]
+            except KeyError:
+                raise ValueError("Spectrum integer length not recognised.")
+            return get_param(self._handle, spectrum_register)
+        else:
+            raise SpectrumDeviceNotConnected("The device has been disconnected.")
+
+    def read_spectrum_device_registers(
+        self,
+        spectrum_registers: Sequence[int],
+        length: SpectrumRegisterLength = SpectrumRegisterLength.THIRTY_TWO,
+    ) -> List[int]:
+        """Get the values of several registers of the same length on the Spectrum device in one go.
+
+        As with `write_to_spectrum_device_registers()`, the driver and connection checks, and the choice of 32 or 64-bit
+        API function, are made once for the whole sequence rather than once per register.
+
+        Args:
+            spectrum_registers (Sequence[int]): Identifiers of the registers to read. These should be global constants
+                imported from spectrum_gmbh.py_header.regs.
+            length (`SpectrumRegisterLength`): A `SpectrumRegisterLength` object specifying the length of all of the
+                registers to read, in bits.
+
+        Returns:
+            values (List[int]): The values of the registers, in the order they were given.
+        """
+        if not SPECTRUM_DRIVERS_FOUND:
+            raise SpectrumDriversNotFound(
+                "Cannot communicate with hardware. For testing on a system without drivers or connected hardware, use"
+                " a mock device instead (e.g. MockSpectrumDigitiserCard or MockSpectrumStarHub)."
+            )
+        if self._connected:
+            try:
+                get_param = _REGISTER_GETTERS[length]
+            except KeyError:
                 raise ValueError("Spectrum integer length not recognised.")
+            handle = self._handle
+            return [get_param(handle, spectrum_register) for spectrum_register in spectrum_registers]
         else:
             raise SpectrumDeviceNotConnected("The device has been disconnected.")
 
@@ -6,9 +6,9 @@ Spectrum cards)."""
 # Licensed under the MIT. You may obtain a copy at https://opensource.org/licenses/MIT.
 
 from abc import ABC
-from functools import reduce
-from operator import or_
-from typing import Any, List, Sequence, Tuple, TypeVar, Generic
+from concurrent.futures import ThreadPoolExecutor, wait
+from threading import Lock
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple, TypeVar, Generic
 
 from numpy import arange
 
@@ -25,15 +25,18 @@ from spectrumdevice.settings import (
     AvailableIOModes,
     CardFeature,
     ClockMode,
+    DEFAULT_HYBRID_WAIT_SPIN_TIME_IN_US,
     ExternalTriggerMode,
     DEVICE_STATUS_TYPE,
     TransferBuffer,
     TriggerSource,
+    WaitStrategy,
 )
 from spectrumdevice.spectrum_wrapper import destroy_handle
 
 
 CardType = TypeVar("CardType", bound=SpectrumDeviceInterface)
+ResultType = TypeVar("ResultType")
 
 
 class AbstractSpectrumStarHub(
@@ -55,10 +58,18 @@ class AbstractSpectrumStarHub(
         self._child_cards: Sequence[CardType] = child_cards
         self._master_card = child_cards[master_card_index]
         self._triggering_card = child_cards[master_card_index]
-        child_card_logical_indices = (2**n for n in range(len(self._child_cards)))
         self._visa_string = f"sync{device_number}"
+        # Calls to the child cards which block (waiting for acquisitions or transfers) or read waveforms are made
+        # concurrently in a thread pool, so that they take as long as the slowest card rather than the sum over all
+        # cards. Quick register writes (settings) are made in plain loops, as a pool hand-off would cost more than it
+        # saves. The pool is created on first use and shut down by disconnect(), so its threads do not outlive the
+        # connection.
+        self._child_card_executor: Optional[ThreadPoolExecutor] = None
+        self._child_card_executor_lock = Lock()
         self._connect(self._visa_string)
-        all_cards_binary_mask = reduce(or_, child_card_logical_indices)
+        all_cards_binary_mask = 0
+        for n in range(len(self._child_cards)):
+            all_cards_binary_mask |= 1 << n
         self.write_to_spectrum_device_register(SPC_SYNC_ENABLEMASK, all_cards_binary_mask)
 
     def disconnect(self) -> None:
@@ -68,6 +79,7 @@ class AbstractSpectrumStarHub(
         for card in self._child_cards:
             card.disconnect()
         self._connected = False
+        self._shut_down_child_card_executor()
 
     def reconnect(self) -> None:
         """Reconnects to the hub after a `disconnect()`, and reconnects to each child card."""
@@ -75,6 +87,18 @@ class AbstractSpectrumStarHub(
         for card in self._child_cards:
             card.reconnect()
 
+    def reset(self) -> None:
+        """Perform a software and hardware reset of the hub. See `AbstractSpectrumDevice.reset()` for more
+        information."""
+        super().reset()
+        self.refresh_cached_registers()
+
+    def refresh_cached_registers(self) -> None:
+        """Discard the cached register values of each child card. See
+        `AbstractSpectrumCard.refresh_cached_registers()` for more information."""
+        for card in self._child_cards:
+            card.refresh_cached_registers()
+
     @property
     def status(self) -> DEVICE_STATUS_TYPE:
         """The statuses of each child card, in a list. See `SpectrumDigitiserCard.status` for more information.
@@ -86,20 +110,17 @@ class AbstractSpectrumStarHub(
     def start_transfer(self) -> None:
         """Start the transfer of data between the on-device buffer of each child card and its `TransferBuffer`. See
         `AbstractSpectrumCard.start_transfer()` for more information."""
-        for card in self._child_cards:
-            card.start_transfer()
+        self._run_on_child_cards(lambda card: card.start_transfer())
 
     def stop_transfer(self) -> None:
         """Stop the transfer of data between each card and its `TransferBuffer`. See
         `AbstractSpectrumCard.stop_transfer()` for more information."""
-        for card in self._child_cards:
-            card.stop_transfer()
+        self._run_on_child_cards(lambda card: card.stop_transfer())
 
     def wait_for_transfer_chunk_to_complete(self) -> None:
         """Wait for all cards to stop transferring data to/from their `TransferBuffers`. See
         `AbstractSpectrumCard.wait_for_transfer_to_complete()` for more information."""
-        for card in self._child_cards:
-            card.wait_for_transfer_chunk_to_complete()
+        self._run_on_child_cards(lambda card: card.wait_for_transfer_chunk_to_complete())
 
     @property
     def connected(self) -> bool:
@@ -308,10 +329,7 @@ class AbstractSpectrumStarHub(
         Returns:
             timeout_ms (int): The currently set timeout in ms.
         """
-        timeouts = []
-        for d in self._child_cards:
-            timeouts.append(d.timeout_in_ms)
-        return check_settings_constant_across_devices(timeouts, __name__)
+        return check_settings_constant_across_devices((card.timeout_in_ms for card in self._child_cards), __name__)
 
     def set_timeout_in_ms(self, timeout_ms: int) -> None:
         """Change the timeout value for all child cards.
@@ -321,6 +339,38 @@ class AbstractSpectrumStarHub(
         for d in self._child_cards:
             d.set_timeout_in_ms(timeout_ms)
 
+    @property
+    def wait_strategy(self) -> WaitStrategy:
+        """How the child cards wait for acquisitions and transfers to complete. This should be the same for all child
+        cards. If it's not, an exception is raised. See `AbstractSpectrumCard.wait_strategy` for more information.
+
+        Returns:
+            strategy (`WaitStrategy`): The current wait strategy.
+        """
+        return WaitStrategy(
+            check_settings_constant_across_devices((card.wait_strategy.value for card in self._child_cards), __name__)
+        )
+
+    def set_wait_strategy(
+        self, strategy: WaitStrategy, hybrid_spin_time_in_us: int = DEFAULT_HYBRID_WAIT_SPIN_TIME_IN_US
+    ) -> None:
+        """Change how all child cards wait for acquisitions and transfers to complete. See
+        `AbstractSpectrumCard.set_wait_strategy()` for more information.
+
+        Args:
+            strategy (`WaitStrategy`): The desired wait strategy.
+            hybrid_spin_time_in_us (int): For `WaitStrategy.HYBRID`, the time for which to poll before falling back to
+                the blocking driver command. 0 disables polling, so the blocking driver command is issued immediately.
+
+        Raises:
+            ValueError: If hybrid_spin_time_in_us is negative.
+        """
+        # checked before any card is changed, so that the child cards are never left with different strategies
+        if hybrid_spin_time_in_us < 0:
+            raise ValueError(f"Hybrid wait spin time must not be negative, but {hybrid_spin_time_in_us} us was given.")
+        for card in self._child_cards:
+            card.set_wait_strategy(strategy, hybrid_spin_time_in_us)
+
     @property
     def feature_list(self) -> List[Tuple[List[CardFeature], List[AdvancedCardFeature]]]:
         """Get a list of the features of the child cards. See `CardFeature`, `AdvancedCardFeature` and the Spectrum
@@ -344,21 +394,48 @@ class AbstractSpectrumStarHub(
 
     @property
     def bytes_per_sample(self) -> int:
-        bytes_per_sample_each_card = []
-        for d in self._child_cards:
-            bytes_per_sample_each_card.append(d.bytes_per_sample)
-        return check_settings_constant_across_devices(bytes_per_sample_each_card, __name__)
+        return check_settings_constant_across_devices((card.bytes_per_sample for card in self._child_cards), __name__)
 
-    def __str__(self) -> str:
-        return f"StarHub {self._visa_string}"
+    def _run_on_child_cards(self, function: Callable[[CardType], ResultType]) -> List[ResultType]:
+        """Calls function once for each child card, concurrently, and waits for all the calls to finish.
 
+        Args:
+            function (Callable[[CardType], ResultType]): The function to call with each child card as its argument.
+
+        Returns:
+            results (List[ResultType]): The value returned by each call, in the order of the child cards. If any calls
+                raised an exception, the exception raised for the first such card is re-raised instead, once all calls
+                have finished.
+        """
+        with self._child_card_executor_lock:
+            if self._child_card_executor is None:
+                self._child_card_executor = ThreadPoolExecutor(
+                    max_workers=len(self._child_cards), thread_name_prefix=f"{self._visa_string}-child-card"
+                )
+            futures = [self._child_card_executor.submit(function, card) for card in self._child_cards]
+        wait(futures)
+        return [future.result() for future in futures]
+
+    def _shut_down_child_card_executor(self) -> None:
+        """Shuts down the thread pool used by `_run_on_child_cards()`, if it has been created. Calls already running
+        are not waited for, but their threads exit once they finish. A new pool is created if one is needed again,
+        e.g. after `reconnect()`."""
+        with self._child_card_executor_lock:
+            if self._child_card_executor is not None:
+                self._child_card_executor.shutdown(wait=False)
+                self._child_card_executor = None
 
-def _are_all_values_equal(values: List[int]) -> bool:
-    return len(set(values)) == 1
+    def __str__(self) -> str:
+        return f"StarHub {self._visa_string}"
 
 
-def check_settings_constant_across_devices(values: List[int], setting_name: str) -> int:
-    if _are_all_values_equal(values):
-        return values[0]
-    else:
+def check_settings_constant_across_devices(values: Iterable[int], setting_name: str) -> int:
+    # Values are consumed lazily, so no further devices are queried once a mismatch has been found
+    values_iterator = iter(values)
+    first_value = next(values_iterator, None)
+    if first_value is None:
         raise SpectrumSettingsMismatchError(f"Devices have different {setting_name} settings")
+    for value in values_iterator:
+        if value != first_value:
+            raise SpectrumSettingsMismatchError(f"Devices have different {setting_name} settings")
+    return first_value
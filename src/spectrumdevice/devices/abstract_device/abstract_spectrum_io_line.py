@@ -9,6 +9,10 @@ from spectrumdevice.features.pulse_generator.interfaces import PulseGeneratorInt
 from spectrumdevice.settings import IOLineMode
 from spectrumdevice.settings.io_lines import IO_LINE_MODE_COMMANDS, SpectrumIOLineName, decode_enabled_io_line_mode
 
+# IO line names, keyed by IO line number. A dict rather than a sequence, so that invalid (including negative) numbers
+# raise KeyError
+_IO_LINE_NAMES = {n: SpectrumIOLineName[f"X{n}"] for n in range(len(SpectrumIOLineName))}
+
 
 class AbstractSpectrumIOLine(SpectrumIOLineInterface, AbstractSpectrumChannel[SpectrumIOLineName], ABC):
     """Partially implemented abstract superclass contain code common for controlling an individual IO Line of all
@@ -26,7 +30,7 @@ class AbstractSpectrumIOLine(SpectrumIOLineInterface, AbstractSpectrumChannel[Sp
         return "X"
 
     def _make_name(self, channel_number: int) -> SpectrumIOLineName:
-        return SpectrumIOLineName[f"{self._name_prefix}{channel_number}"]
+        return _IO_LINE_NAMES[channel_number]
 
     @abstractmethod
     def _get_io_line_mode_settings_mask(self, mode: IOLineMode) -> int:
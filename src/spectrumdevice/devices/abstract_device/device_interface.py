@@ -10,6 +10,7 @@ from spectrumdevice.settings import (
     AvailableIOModes,
     CardFeature,
     ClockMode,
+    DEFAULT_HYBRID_WAIT_SPIN_TIME_IN_US,
     DEVICE_STATUS_TYPE,
     ExternalTriggerMode,
     ModelNumber,
@@ -17,6 +18,7 @@ from spectrumdevice.settings import (
     TransferBuffer,
     TriggerSettings,
     TriggerSource,
+    WaitStrategy,
 )
 from spectrumdevice.settings.card_dependent_properties import CardType
 from spectrumdevice.settings.output_channel_pairing import ChannelPair, ChannelPairingMode
@@ -43,6 +45,10 @@ class SpectrumDeviceInterface(Generic[AnalogChannelInterfaceType, IOLineInterfac
     def reset(self) -> None:
         raise NotImplementedError()
 
+    @abstractmethod
+    def refresh_cached_registers(self) -> None:
+        raise NotImplementedError()
+
     @property
     def status(self) -> DEVICE_STATUS_TYPE:
         raise NotImplementedError()
@@ -183,6 +189,14 @@ class SpectrumDeviceInterface(Generic[AnalogChannelInterfaceType, IOLineInterfac
     ) -> None:
         raise NotImplementedError()
 
+    @abstractmethod
+    def write_to_spectrum_device_registers(
+        self,
+        register_values: Sequence[Tuple[int, int]],
+        length: SpectrumRegisterLength = SpectrumRegisterLength.THIRTY_TWO,
+    ) -> None:
+        raise NotImplementedError()
+
     @abstractmethod
     def read_spectrum_device_register(
         self,
@@ -191,6 +205,14 @@ class SpectrumDeviceInterface(Generic[AnalogChannelInterfaceType, IOLineInterfac
     ) -> int:
         raise NotImplementedError()
 
+    @abstractmethod
+    def read_spectrum_device_registers(
+        self,
+        spectrum_registers: Sequence[int],
+        length: SpectrumRegisterLength = SpectrumRegisterLength.THIRTY_TWO,
+    ) -> List[int]:
+        raise NotImplementedError()
+
     @property
     @abstractmethod
     def timeout_in_ms(self) -> int:
@@ -200,6 +222,17 @@ class SpectrumDeviceInterface(Generic[AnalogChannelInterfaceType, IOLineInterfac
     def set_timeout_in_ms(self, timeout_in_ms: int) -> None:
         raise NotImplementedError()
 
+    @property
+    @abstractmethod
+    def wait_strategy(self) -> WaitStrategy:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def set_wait_strategy(
+        self, strategy: WaitStrategy, hybrid_spin_time_in_us: int = DEFAULT_HYBRID_WAIT_SPIN_TIME_IN_US
+    ) -> None:
+        raise NotImplementedError()
+
     @abstractmethod
     def force_trigger(self) -> None:
         raise NotImplementedError()
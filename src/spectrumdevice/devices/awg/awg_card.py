@@ -33,8 +33,9 @@ class SpectrumAWGCard(
     """Class for controlling individual Spectrum AWG cards."""
 
     def _init_analog_channels(self) -> Sequence[SpectrumAWGAnalogChannelInterface]:
-        num_modules = self.read_spectrum_device_register(SPC_MIINST_MODULES)
-        num_channels_per_module = self.read_spectrum_device_register(SPC_MIINST_CHPERMODULE)
+        num_modules, num_channels_per_module = self.read_spectrum_device_registers(
+            [SPC_MIINST_MODULES, SPC_MIINST_CHPERMODULE]
+        )
         total_channels = num_modules * num_channels_per_module
         return tuple([SpectrumAWGAnalogChannel(channel_number=n, parent_device=self) for n in range(total_channels)])
 
@@ -34,9 +34,23 @@ class AbstractSpectrumDigitiser(
 
         Args:
             settings (`AcquisitionSettings`): An `AcquisitionSettings` dataclass containing the setting values to apply.
+
+        Raises:
+            ValueError: If the settings are inconsistent, e.g. if there is not one vertical range, vertical offset and
+                input impedance per enabled channel. Nothing is applied in this case.
         """
         if settings.batch_size > 1 and settings.acquisition_mode == AcquisitionMode.SPC_REC_STD_SINGLE:
             raise ValueError("In standard single mode, only 1 acquisition can be downloaded at a time.")
+        for description, channel_values in (
+            ("vertical ranges", settings.vertical_ranges_in_mv),
+            ("vertical offsets", settings.vertical_offsets_in_percent),
+            ("input impedances", settings.input_impedances),
+        ):
+            if len(channel_values) != len(settings.enabled_channels):
+                raise ValueError(
+                    f"{len(channel_values)} {description} were provided for {len(settings.enabled_channels)} enabled "
+                    f"channels. Provide one value per enabled channel."
+                )
         self._acquisition_mode = settings.acquisition_mode
         self.set_batch_size(settings.batch_size)
         self.set_acquisition_mode(settings.acquisition_mode)
@@ -49,16 +63,11 @@ class AbstractSpectrumDigitiser(
         self.set_enabled_analog_channels(settings.enabled_channels)
 
         # Apply channel dependent settings
-        for channel_num, v_range, v_offset, impedance in zip(
-            self.enabled_analog_channel_nums,
-            settings.vertical_ranges_in_mv,
-            settings.vertical_offsets_in_percent,
-            settings.input_impedances,
-        ):
-            channel = self.analog_channels[channel_num]
-            channel.set_vertical_range_in_mv(v_range)
-            channel.set_vertical_offset_in_percent(v_offset)
-            channel.set_input_impedance(impedance)
+        enabled_analog_channel_nums = self.enabled_analog_channel_nums
+        self.set_vertical_ranges_in_mv(settings.vertical_ranges_in_mv, enabled_analog_channel_nums)
+        self.set_vertical_offsets_in_percent(settings.vertical_offsets_in_percent, enabled_analog_channel_nums)
+        for channel_num, impedance in zip(enabled_analog_channel_nums, settings.input_impedances):
+            self.analog_channels[channel_num].set_input_impedance(impedance)
 
         # Only some hardware has software programmable input coupling, so coupling can be None
         if settings.input_couplings is not None:
@@ -139,12 +148,11 @@ class AbstractSpectrumDigitiser(
                 " batch size configured using AbstractSpectrumDigitiser.configure_acquisition()."
             )
         self.execute_continuous_fifo_acquisition()
-        measurements = []
+        get_waveforms = self.get_raw_waveforms if raw else self.get_waveforms
+        measurements: List[Measurement] = []
         for _ in range(num_measurements // self.batch_size):
-            waveforms: list[list[RawWaveformType]] | list[list[VoltageWaveformType]] = (
-                self.get_raw_waveforms() if raw else self.get_waveforms()
-            )
-            measurements += [Measurement(waveforms=frame, timestamp=self.get_timestamp()) for frame in waveforms]
+            waveforms: list[list[RawWaveformType]] | list[list[VoltageWaveformType]] = get_waveforms()
+            measurements.extend(Measurement(waveforms=frame, timestamp=self.get_timestamp()) for frame in waveforms)
         self.stop()
         return measurements
 
@@ -5,19 +5,19 @@
 # Licensed under the MIT. You may obtain a copy at https://opensource.org/licenses/MIT.
 import datetime
 import logging
-from typing import List, Optional, Sequence, cast
+from typing import List, Optional, Sequence, Tuple, cast
 
-from numpy import float64, int16, mod, squeeze, zeros
+from numpy import empty, float64, int16, multiply, newaxis, zeros
 from numpy.typing import NDArray
 
 from spectrum_gmbh.py_header.regs import (
     M2CMD_CARD_WAITREADY,
+    M2STAT_CARD_READY,
     SPC_AVERAGES,
     SPC_CARDMODE,
     SPC_DATA_AVAIL_CARD_LEN,
     SPC_DATA_AVAIL_USER_LEN,
     SPC_DATA_AVAIL_USER_POS,
-    SPC_M2CMD,
     SPC_MEMSIZE,
     SPC_MIINST_CHPERMODULE,
     SPC_MIINST_MODULES,
@@ -40,6 +40,7 @@ from spectrumdevice.exceptions import (
 )
 from spectrumdevice.settings import TransferBuffer
 from spectrumdevice.settings.card_dependent_properties import CardType, get_memsize_step_size
+from spectrumdevice.settings.channel import VERTICAL_OFFSET_COMMANDS, VERTICAL_RANGE_COMMANDS
 from spectrumdevice.settings.device_modes import AcquisitionMode
 from spectrumdevice.settings.transfer_buffer import (
     BufferDirection,
@@ -48,10 +49,15 @@ from spectrumdevice.settings.transfer_buffer import (
     set_transfer_buffer,
     PAGE_SIZE_IN_BYTES,
     DEFAULT_NOTIFY_SIZE_IN_PAGES,
+    NUM_BATCHES_IN_FIFO_TRANSFER_BUFFER,
 )
 
 logger = logging.getLogger(__name__)
 
+# Converting register values to Enum members with a dict is faster than calling the Enum constructor. Unrecognised values
+# fall back to the constructor, which raises the usual ValueError.
+_ACQUISITION_MODES_BY_VALUE = {mode.value: mode for mode in AcquisitionMode}
+
 
 class SpectrumDigitiserCard(
     AbstractSpectrumCard[SpectrumDigitiserAnalogChannelInterface, SpectrumDigitiserIOLineInterface],
@@ -74,10 +80,15 @@ class SpectrumDigitiserCard(
         self._acquisition_mode = self.acquisition_mode
         self._timestamper: Optional[Timestamper] = None
         self._batch_size = 1
+        self._transfer_buffer_is_user_defined = False
+        self._memsize_step_size: Optional[int] = None
+        # samples read out of the transfer buffer in FIFO mode, reused by get_waveforms() while its shape is unchanged
+        self._fifo_samples_scratch: Optional[NDArray[int16]] = None
 
     def _init_analog_channels(self) -> Sequence[SpectrumDigitiserAnalogChannelInterface]:
-        num_modules = self.read_spectrum_device_register(SPC_MIINST_MODULES)
-        num_channels_per_module = self.read_spectrum_device_register(SPC_MIINST_CHPERMODULE)
+        num_modules, num_channels_per_module = self.read_spectrum_device_registers(
+            [SPC_MIINST_MODULES, SPC_MIINST_CHPERMODULE]
+        )
         total_channels = num_modules * num_channels_per_module
         return tuple(
             [SpectrumDigitiserAnalogChannel(channel_number=n, parent_device=self) for n in range(total_channels)]
@@ -103,7 +114,7 @@ class SpectrumDigitiserCard(
             `stop()` is called, so `wait_for_acquisition_to_complete()` should not be used.
 
         """
-        self.write_to_spectrum_device_register(SPC_M2CMD, M2CMD_CARD_WAITREADY)
+        self._wait_for_status(M2STAT_CARD_READY, M2CMD_CARD_WAITREADY)
 
     def get_raw_waveforms(self) -> List[List[NDArray[int16]]]:
         """Get a list of the most recently transferred waveforms, in channel order, as 16-bit integers.
@@ -125,53 +136,83 @@ class SpectrumDigitiserCard(
                 `np.array(waveforms).mean(axis=0)`
 
         """
+        waveforms_in_columns = self._get_raw_samples_in_columns(copy_samples=True)
+        return [list(waveforms_in_columns[n].T) for n in range(self._batch_size)]
+
+    def _get_raw_samples_in_columns(self, copy_samples: bool) -> NDArray[int16]:
+        """Gets the most recently transferred samples from the `TransferBuffer`, shaped as
+        (batch_size, acquisition_length_in_samples, num_enabled_channels).
+
+        In FIFO mode the samples are always read out of the buffer, because the card is free to overwrite each chunk as
+        soon as it has been read. In Standard mode the card only writes to the buffer when a transfer is started. If
+        copy_samples is True the returned array belongs to the caller. If it is False, then in Standard mode a view of
+        the buffer is returned, and in FIFO mode the samples are read into an array which is reused by the next call.
+        Callers must then have finished with the array before calling this method again."""
         if self._transfer_buffer is None:
             raise SpectrumNoTransferBufferDefined("Cannot find a samples transfer buffer")
 
-        num_read_bytes = 0
-        num_samples_per_frame = self.acquisition_length_in_samples * len(self.enabled_analog_channel_nums)
-        num_expected_bytes_per_frame = num_samples_per_frame * self._transfer_buffer.data_array.itemsize
-        raw_samples = zeros(num_samples_per_frame * self._batch_size, dtype=self._transfer_buffer.data_array.dtype)
+        acquisition_mode = self.acquisition_mode
+        acquisition_length_in_samples = self.acquisition_length_in_samples
+        num_enabled_channels = len(self.enabled_analog_channel_nums)
+        batch_size = self._batch_size
 
-        if self.acquisition_mode in (AcquisitionMode.SPC_REC_STD_SINGLE, AcquisitionMode.SPC_REC_STD_AVERAGE):
-            raw_samples = self._transfer_buffer.copy_contents()
+        if acquisition_mode in (AcquisitionMode.SPC_REC_STD_SINGLE, AcquisitionMode.SPC_REC_STD_AVERAGE):
+            if copy_samples:
+                raw_samples = self._transfer_buffer.copy_contents()
+            else:
+                raw_samples = self._transfer_buffer.data_array
+
+        elif acquisition_mode in (AcquisitionMode.SPC_REC_FIFO_MULTI, AcquisitionMode.SPC_REC_FIFO_AVERAGE):
+            transfer_buffer = self._transfer_buffer
+            item_size = transfer_buffer.data_array.itemsize
+            transfer_buffer_length_in_bytes = transfer_buffer.data_array_length_in_bytes
+            num_expected_bytes = acquisition_length_in_samples * num_enabled_channels * item_size * batch_size
+            # every element is overwritten by the read loop below, so there is no need to zero the array first
+            scratch = self._fifo_samples_scratch
+            if (
+                not copy_samples
+                and scratch is not None
+                and scratch.size * item_size == num_expected_bytes
+                and scratch.dtype == transfer_buffer.data_array.dtype
+            ):
+                raw_samples = scratch
+            else:
+                raw_samples = empty(num_expected_bytes // item_size, dtype=transfer_buffer.data_array.dtype)
+                if not copy_samples:
+                    self._fifo_samples_scratch = raw_samples
+            num_read_bytes = 0
 
-        elif self.acquisition_mode in (AcquisitionMode.SPC_REC_FIFO_MULTI, AcquisitionMode.SPC_REC_FIFO_AVERAGE):
             self.wait_for_transfer_chunk_to_complete()
 
-            while num_read_bytes < (num_expected_bytes_per_frame * self._batch_size):
+            while num_read_bytes < num_expected_bytes:
                 num_available_bytes = self.read_spectrum_device_register(SPC_DATA_AVAIL_USER_LEN)
                 position_of_available_bytes = self.read_spectrum_device_register(SPC_DATA_AVAIL_USER_POS)
 
                 # Don't allow reading over the end of the transfer buffer
-                if (
-                    position_of_available_bytes + num_available_bytes
-                ) > self._transfer_buffer.data_array_length_in_bytes:
-                    num_available_bytes = self._transfer_buffer.data_array_length_in_bytes - position_of_available_bytes
+                if (position_of_available_bytes + num_available_bytes) > transfer_buffer_length_in_bytes:
+                    num_available_bytes = transfer_buffer_length_in_bytes - position_of_available_bytes
 
                 # Don't allow reading over the end of the current acquisition:
-                if (num_read_bytes + num_available_bytes) > (num_expected_bytes_per_frame * self._batch_size):
-                    num_available_bytes = (num_expected_bytes_per_frame * self._batch_size) - num_read_bytes
+                if (num_read_bytes + num_available_bytes) > num_expected_bytes:
+                    num_available_bytes = num_expected_bytes - num_read_bytes
 
-                num_available_samples = num_available_bytes // self._transfer_buffer.data_array.itemsize
-                num_read_samples = num_read_bytes // self._transfer_buffer.data_array.itemsize
+                num_available_samples = num_available_bytes // item_size
+                num_read_samples = num_read_bytes // item_size
 
-                raw_samples[
-                    num_read_samples : num_read_samples + num_available_samples
-                ] = self._transfer_buffer.read_chunk(position_of_available_bytes, num_available_bytes)
+                raw_samples[num_read_samples : num_read_samples + num_available_samples] = transfer_buffer.read_chunk(
+                    position_of_available_bytes, num_available_bytes
+                )
                 self.write_to_spectrum_device_register(SPC_DATA_AVAIL_CARD_LEN, num_available_bytes)
 
                 num_read_bytes += num_available_bytes
 
-        waveforms_in_columns = raw_samples.reshape(
-            (self._batch_size, self.acquisition_length_in_samples, len(self.enabled_analog_channel_nums))
-        )
-
-        repeat_acquisitions = []
-        for n in range(self._batch_size):
-            repeat_acquisitions.append([waveform for waveform in waveforms_in_columns[n, :, :].T])
+        else:
+            raw_samples = zeros(
+                acquisition_length_in_samples * num_enabled_channels * batch_size,
+                dtype=self._transfer_buffer.data_array.dtype,
+            )
 
-        return repeat_acquisitions
+        return raw_samples.reshape((batch_size, acquisition_length_in_samples, num_enabled_channels))
 
     def get_waveforms(self) -> List[List[NDArray[float64]]]:
         """Get a list of the most recently transferred waveforms, in channel order, in Volts as floats.
@@ -184,18 +225,23 @@ class SpectrumDigitiserCard(
                 `np.array(waveforms).mean(axis=0)`
 
         """
-        raw_repeat_acquisitions = self.get_raw_waveforms()
-        repeat_acquisitions = []
-        for n in range(self._batch_size):
-            repeat_acquisitions.append(
-                [
-                    cast(
-                        SpectrumDigitiserAnalogChannel, self.analog_channels[ch_num]
-                    ).convert_raw_waveform_to_voltage_waveform(squeeze(waveform))
-                    for ch_num, waveform in zip(self.enabled_analog_channel_nums, raw_repeat_acquisitions[n])
-                ]
-            )
-        return repeat_acquisitions
+        # the conversion to Volts writes into a new array, so the raw samples need not be copied or kept
+        waveforms_in_columns = self._get_raw_samples_in_columns(copy_samples=False)
+        batch_size, acquisition_length_in_samples, num_enabled_channels = waveforms_in_columns.shape
+
+        # Convert every channel of every acquisition in one broadcast operation, using one gain and offset per channel,
+        # rather than converting each waveform separately. Writing into a (batch, channel, sample) array means each
+        # returned waveform is a contiguous view of it.
+        gains = empty(num_enabled_channels, dtype=float64)
+        offsets = empty(num_enabled_channels, dtype=float64)
+        for i, ch_num in enumerate(self.enabled_analog_channel_nums):
+            channel = cast(SpectrumDigitiserAnalogChannel, self._analog_channels[ch_num])
+            gains[i], offsets[i] = channel._get_voltage_gain_and_offset()
+        voltages = empty((batch_size, num_enabled_channels, acquisition_length_in_samples), dtype=float64)
+        multiply(waveforms_in_columns.transpose(0, 2, 1), gains[:, newaxis], out=voltages)
+        voltages += offsets[:, newaxis]
+
+        return [list(voltages[n]) for n in range(batch_size)]
 
     def get_timestamp(self) -> Optional[datetime.datetime]:
         """Get timestamp for the last acquisition"""
@@ -204,13 +250,21 @@ class SpectrumDigitiserCard(
         else:
             return None
 
+    def get_timestamp_ns(self) -> Optional[int]:
+        """Get timestamp for the last acquisition, as an integer number of nanoseconds since the epoch. Cheaper than
+        `get_timestamp()` as no datetime is constructed."""
+        if self._timestamper is not None:
+            return self._timestamper.get_timestamp_ns()
+        else:
+            return None
+
     @property
     def acquisition_length_in_samples(self) -> int:
         """The current recording length (per channel) in samples.
 
         Returns:
             length_in_samples (int): The current recording length ('acquisition length') in samples."""
-        return self.read_spectrum_device_register(SPC_MEMSIZE)
+        return self._read_cached_register(SPC_MEMSIZE)
 
     def set_acquisition_length_in_samples(self, length_in_samples: int) -> None:
         """Change the recording length (per channel). In FIFO mode, it will be quantised according to the step size
@@ -220,8 +274,9 @@ class SpectrumDigitiserCard(
             length_in_samples (int): The desired recording length ('acquisition length'), in samples.
         """
         length_in_samples = self._coerce_num_samples_if_fifo(length_in_samples)
-        self.write_to_spectrum_device_register(SPC_SEGMENTSIZE, length_in_samples)
-        self.write_to_spectrum_device_register(SPC_MEMSIZE, length_in_samples)
+        self.write_to_spectrum_device_registers(
+            [(SPC_SEGMENTSIZE, length_in_samples), (SPC_MEMSIZE, length_in_samples)]
+        )
 
     @property
     def post_trigger_length_in_samples(self) -> int:
@@ -230,7 +285,7 @@ class SpectrumDigitiserCard(
         Returns:
             length_in_samples (int): The currently set post trigger length in samples.
         """
-        return self.read_spectrum_device_register(SPC_POSTTRIGGER)
+        return self._read_cached_register(SPC_POSTTRIGGER)
 
     def set_post_trigger_length_in_samples(self, length_in_samples: int) -> None:
         """Change the number of samples of the recording that will contain data received after the trigger event.
@@ -238,25 +293,37 @@ class SpectrumDigitiserCard(
 
         Args:
             length_in_samples (int): The desired post trigger length in samples."""
-        length_in_samples = self._coerce_num_samples_if_fifo(length_in_samples)
-        if self.acquisition_mode == AcquisitionMode.SPC_REC_FIFO_MULTI:
-            if (self.acquisition_length_in_samples - length_in_samples) < get_memsize_step_size(self._model_number):
+        if self.acquisition_mode is AcquisitionMode.SPC_REC_FIFO_MULTI:
+            length_in_samples = self._coerce_num_samples_to_fifo_step_size(length_in_samples)
+            step_size = self._get_memsize_step_size()
+            acquisition_length_in_samples = self.acquisition_length_in_samples
+            if (acquisition_length_in_samples - length_in_samples) < step_size:
                 logger.warning(
                     "FIFO mode: coercing post trigger length to maximum allowed value (step-size samples less than "
                     "the acquisition length)."
                 )
-                length_in_samples = self.acquisition_length_in_samples - get_memsize_step_size(self._model_number)
-        self.write_to_spectrum_device_register(SPC_POSTTRIGGER, length_in_samples)
+                length_in_samples = acquisition_length_in_samples - step_size
+        self._write_to_cached_register(SPC_POSTTRIGGER, length_in_samples)
 
     def _coerce_num_samples_if_fifo(self, value: int) -> int:
-        if self.acquisition_mode == AcquisitionMode.SPC_REC_FIFO_MULTI:
-            if mod(value, get_memsize_step_size(self._model_number)) != 0:
-                logger.warning(
-                    f"FIFO mode: coercing length to nearest {get_memsize_step_size(self._model_number)}" f" samples"
-                )
-                value = int(value - mod(value, get_memsize_step_size(self._model_number)))
+        if self.acquisition_mode is not AcquisitionMode.SPC_REC_FIFO_MULTI:
+            return value
+        return self._coerce_num_samples_to_fifo_step_size(value)
+
+    def _coerce_num_samples_to_fifo_step_size(self, value: int) -> int:
+        step_size = self._get_memsize_step_size()
+        remainder = value % step_size
+        if remainder != 0:
+            logger.warning(f"FIFO mode: coercing length to nearest {step_size} samples")
+            value -= remainder
         return value
 
+    def _get_memsize_step_size(self) -> int:
+        # The model number never changes, so the step size is looked up once and then kept
+        if self._memsize_step_size is None:
+            self._memsize_step_size = get_memsize_step_size(self._model_number)
+        return self._memsize_step_size
+
     @property
     def number_of_averages(self) -> int:
         return self.read_spectrum_device_register(SPC_AVERAGES)
@@ -274,7 +341,8 @@ class SpectrumDigitiserCard(
 
         Returns:
             mode (`AcquisitionMode`): The currently enabled card acquisition mode."""
-        return AcquisitionMode(self.read_spectrum_device_register(SPC_CARDMODE))
+        mode_value = self._read_cached_register(SPC_CARDMODE)
+        return _ACQUISITION_MODES_BY_VALUE.get(mode_value) or AcquisitionMode(mode_value)
 
     def set_acquisition_mode(self, mode: AcquisitionMode) -> None:
         """Change the currently enabled card mode. See `AcquisitionMode` and the Spectrum documentation
@@ -282,7 +350,7 @@ class SpectrumDigitiserCard(
 
         Args:
             mode (`AcquisitionMode`): The desired acquisition mode."""
-        self.write_to_spectrum_device_register(SPC_CARDMODE, mode.value)
+        self._write_to_cached_register(SPC_CARDMODE, mode.value)
 
     @property
     def batch_size(self) -> int:
@@ -291,13 +359,82 @@ class SpectrumDigitiserCard(
     def set_batch_size(self, batch_size: int) -> None:
         self._batch_size = batch_size
 
+    def set_vertical_ranges_in_mv(self, vertical_ranges: Sequence[int], channel_nums: Sequence[int]) -> None:
+        """Set the input ranges of several channels in mV, writing all the range registers of the card in a single
+        pass. See `SpectrumDigitiserAnalogChannel.set_vertical_range_in_mv()` for more information.
+
+        Args:
+            vertical_ranges (Sequence[int]): The desired vertical ranges in mV, one per channel in channel_nums.
+            channel_nums (Sequence[int]): The indices of the channels to configure.
+
+        Raises:
+            ValueError: If vertical_ranges and channel_nums have different lengths, or a channel number is not a
+                channel of this card. Nothing is written in either case.
+        """
+        self._check_channel_values(vertical_ranges, channel_nums, "vertical ranges")
+        channels_and_ranges = list(zip(channel_nums, vertical_ranges))
+        # skip registers which the card is already known to hold the value of
+        register_cache = self._register_cache
+        register_values = [
+            (VERTICAL_RANGE_COMMANDS[channel_num], v_range)
+            for channel_num, v_range in channels_and_ranges
+            if register_cache.get(VERTICAL_RANGE_COMMANDS[channel_num]) != v_range
+        ]
+        self.write_to_spectrum_device_registers(register_values)
+        for channel_num, v_range in channels_and_ranges:
+            channel = cast(SpectrumDigitiserAnalogChannel, self._analog_channels[channel_num])
+            channel._vertical_range_mv = v_range
+            channel._update_voltage_conversion()
+
+    def set_vertical_offsets_in_percent(self, offsets: Sequence[int], channel_nums: Sequence[int]) -> None:
+        """Set the input offsets of several channels in percent of their vertical ranges, writing all the offset
+        registers of the card in a single pass. See `SpectrumDigitiserAnalogChannel.set_vertical_offset_in_percent()`
+        for more information.
+
+        Args:
+            offsets (Sequence[int]): The desired vertical offsets in percent, one per channel in channel_nums.
+            channel_nums (Sequence[int]): The indices of the channels to configure.
+
+        Raises:
+            ValueError: If offsets and channel_nums have different lengths, or a channel number is not a channel of
+                this card. Nothing is written in either case.
+        """
+        self._check_channel_values(offsets, channel_nums, "vertical offsets")
+        channels_and_offsets = list(zip(channel_nums, offsets))
+        # skip registers which the card is already known to hold the value of
+        register_cache = self._register_cache
+        register_values = [
+            (VERTICAL_OFFSET_COMMANDS[channel_num], offset)
+            for channel_num, offset in channels_and_offsets
+            if register_cache.get(VERTICAL_OFFSET_COMMANDS[channel_num]) != offset
+        ]
+        self.write_to_spectrum_device_registers(register_values)
+        for channel_num, offset in channels_and_offsets:
+            channel = cast(SpectrumDigitiserAnalogChannel, self._analog_channels[channel_num])
+            channel._vertical_offset_in_percent = offset
+            channel._update_voltage_conversion()
+
+    def _check_channel_values(self, values: Sequence[int], channel_nums: Sequence[int], description: str) -> None:
+        """Checks that there is one value per channel and that every channel number is a channel of this card, so that
+        the batch setters can fail before writing any registers."""
+        if len(values) != len(channel_nums):
+            raise ValueError(
+                f"{len(values)} {description} were provided for {len(channel_nums)} channels. "
+                f"Provide one value per channel."
+            )
+        num_channels = len(self._analog_channels)
+        invalid_channel_nums = [n for n in channel_nums if not 0 <= n < num_channels]
+        if invalid_channel_nums:
+            raise ValueError(f"{self} has {num_channels} channels, so {invalid_channel_nums} are not valid channels.")
+
     def define_transfer_buffer(self, buffer: Optional[Sequence[TransferBuffer]] = None) -> None:
         """Create or provide a `TransferBuffer` object for receiving acquired samples from the device.
 
         If no buffer is provided, and no buffer has previously been defined, then one will be created: in FIFO mode,
-         with a notify size of 10 pages or the size of the acquisition, whichever is smaller; in Standard Single mode,
-         one with the correct length and no notify size. A separate buffer for transferring Timestamps will also be
-         created using the Timestamper class.
+         with a notify size of 10 pages or the size of the acquisition, whichever is smaller, and room for three
+         batches of acquisitions so that the card can keep transferring while a batch is being read; in Standard Single
+         mode, one with the correct length and no notify size. A previously created buffer is reused if it is still the
+         correct size. A separate buffer for transferring Timestamps will also be created using the Timestamper class.
 
         Args:
             buffer (Optional[List[`TransferBuffer`]]): A length-1 list containing a pre-constructed
@@ -312,36 +449,43 @@ class SpectrumDigitiserCard(
     def _set_or_update_transfer_buffer_attribute(self, buffer: Optional[Sequence[TransferBuffer]]) -> None:
         if buffer:
             self._transfer_buffer = buffer[0]
+            self._transfer_buffer_is_user_defined = True
             if self._transfer_buffer.direction != BufferDirection.SPCM_DIR_CARDTOPC:
                 raise ValueError("Digitisers need a transfer buffer with direction BufferDirection.SPCM_DIR_CARDTOPC")
             if self._transfer_buffer.type != BufferType.SPCM_BUF_DATA:
                 raise ValueError("Digitisers need a transfer buffer with type BufferDirection.SPCM_BUF_DATA")
-        elif self._transfer_buffer is None:
-            if self.acquisition_mode in (AcquisitionMode.SPC_REC_FIFO_MULTI, AcquisitionMode.SPC_REC_FIFO_AVERAGE):
-                samples_per_batch = (
-                    self.acquisition_length_in_samples * len(self.enabled_analog_channel_nums) * self._batch_size
-                )
-                pages_per_batch = samples_per_batch * self.bytes_per_sample / PAGE_SIZE_IN_BYTES
-
-                if pages_per_batch < DEFAULT_NOTIFY_SIZE_IN_PAGES:
-                    notify_size = pages_per_batch
-                else:
-                    notify_size = DEFAULT_NOTIFY_SIZE_IN_PAGES
-
-                # Make transfer buffer big enough to hold all samples in the batch
+        elif self._transfer_buffer is None or not self._transfer_buffer_is_user_defined:
+            size_in_samples, notify_size = self._default_transfer_buffer_dimensions()
+            # Buffers are only reallocated if the acquisition configuration has changed since the last one was created,
+            # so the same memory is reused for every acquisition between calls to configure_acquisition().
+            if (
+                self._transfer_buffer is None
+                or self._transfer_buffer.data_array.size != size_in_samples
+                or self._transfer_buffer.notify_size_in_pages != notify_size
+            ):
                 self._transfer_buffer = create_samples_acquisition_transfer_buffer(
-                    size_in_samples=samples_per_batch,
+                    size_in_samples=size_in_samples,
                     notify_size_in_pages=notify_size,
                     bytes_per_sample=self.bytes_per_sample,
                 )
-            elif self.acquisition_mode in (AcquisitionMode.SPC_REC_STD_SINGLE, AcquisitionMode.SPC_REC_STD_AVERAGE):
-                self._transfer_buffer = create_samples_acquisition_transfer_buffer(
-                    size_in_samples=self.acquisition_length_in_samples * len(self.enabled_analog_channel_nums),
-                    notify_size_in_pages=0,
-                    bytes_per_sample=self.bytes_per_sample,
-                )
-            else:
-                raise ValueError("AcquisitionMode not recognised")
+                self._transfer_buffer_is_user_defined = False
+
+    def _default_transfer_buffer_dimensions(self) -> Tuple[int, float]:
+        acquisition_mode = self.acquisition_mode
+        samples_per_acquisition = self.acquisition_length_in_samples * len(self.enabled_analog_channel_nums)
+        if acquisition_mode in (AcquisitionMode.SPC_REC_FIFO_MULTI, AcquisitionMode.SPC_REC_FIFO_AVERAGE):
+            # Make the transfer buffer big enough to hold several batches, so that the card can continue to fill it
+            # while the previous batch is being read out and processed by get_waveforms()
+            samples_per_batch = samples_per_acquisition * self._batch_size
+            pages_per_batch = samples_per_batch * self.bytes_per_sample / PAGE_SIZE_IN_BYTES
+            return (
+                samples_per_batch * NUM_BATCHES_IN_FIFO_TRANSFER_BUFFER,
+                min(pages_per_batch, DEFAULT_NOTIFY_SIZE_IN_PAGES),
+            )
+        elif acquisition_mode in (AcquisitionMode.SPC_REC_STD_SINGLE, AcquisitionMode.SPC_REC_STD_AVERAGE):
+            return samples_per_acquisition, 0
+        else:
+            raise ValueError("AcquisitionMode not recognised")
 
     def __str__(self) -> str:
         return f"Card {self._visa_string}"
@@ -1,18 +1,18 @@
 """Provides a concrete class for configuring the individual channels of Spectrum digitiser devices."""
-from typing import Any
+from typing import Any, Tuple, Type
 
 # Christian Baker, King's College London
 # Copyright (c) 2024 School of Biomedical Engineering & Imaging Sciences, King's College London
 # Licensed under the MIT. You may obtain a copy at https://opensource.org/licenses/MIT.
 
-from numpy import ndarray
+from numpy import float64, floating, multiply, ndarray
+from numpy.typing import NDArray
 
 from spectrum_gmbh.py_header.regs import SPC_MIINST_MAXADCVALUE
 from spectrumdevice.devices.abstract_device import AbstractSpectrumCard
 from spectrumdevice.devices.abstract_device.abstract_spectrum_channel import AbstractSpectrumAnalogChannel
 from spectrumdevice.devices.abstract_device.abstract_spectrum_io_line import AbstractSpectrumIOLine
 from spectrumdevice.devices.digitiser.digitiser_interface import (
-    SpectrumDigitiserInterface,
     SpectrumDigitiserAnalogChannelInterface,
     SpectrumDigitiserIOLineInterface,
 )
@@ -48,7 +48,7 @@ class SpectrumDigitiserAnalogChannel(AbstractSpectrumAnalogChannel, SpectrumDigi
     a `SpectrumDigitiserCard` or `SpectrumDigitiserStarHub` is instantiated, and can then be accessed via the
     `.channels` property."""
 
-    def __init__(self, channel_number: int, parent_device: SpectrumDigitiserInterface) -> None:
+    def __init__(self, channel_number: int, parent_device: AbstractSpectrumCard) -> None:
 
         if parent_device.type != CardType.SPCM_TYPE_AI:
             raise SpectrumCardIsNotADigitiser(parent_device.type)
@@ -56,10 +56,20 @@ class SpectrumDigitiserAnalogChannel(AbstractSpectrumAnalogChannel, SpectrumDigi
         # pass unused args up the inheritance hierarchy
         super().__init__(channel_number=channel_number, parent_device=parent_device)
 
-        self._full_scale_value = self._parent_device.read_spectrum_device_register(SPC_MIINST_MAXADCVALUE)
+        # registers are read through the parent card's register cache, so the full scale value, which is the same for
+        # all channels, is read once per card, and the range and offset are only read from the card after being set.
+        # Stored separately from _parent_device, which is only typed as a SpectrumDeviceInterface.
+        self._parent_card = parent_device
+        self._full_scale_value = self._parent_card._read_cached_register(SPC_MIINST_MAXADCVALUE)
         # used frequently so store locally instead of reading from device each time:
-        self._vertical_range_mv = self.vertical_range_in_mv
-        self._vertical_offset_in_percent = self.vertical_offset_in_percent
+        self._vertical_range_mv = self._parent_card._read_cached_register(VERTICAL_RANGE_COMMANDS[self._number])
+        self._vertical_offset_in_percent = self._parent_card._read_cached_register(
+            VERTICAL_OFFSET_COMMANDS[self._number]
+        )
+        # gain and offset used to convert raw samples to Volts, recomputed whenever the range or offset change:
+        self._voltage_gain = 0.0
+        self._voltage_offset = 0.0
+        self._update_voltage_conversion()
 
     def _get_settings_as_dict(self) -> dict:
         return {
@@ -79,11 +89,32 @@ class SpectrumDigitiserAnalogChannel(AbstractSpectrumAnalogChannel, SpectrumDigi
             settings[SpectrumDigitiserAnalogChannel.vertical_offset_in_percent.__name__]
         )
 
-    def convert_raw_waveform_to_voltage_waveform(self, raw_waveform: ndarray) -> ndarray:
-        vertical_offset_mv = 0.01 * float(self._vertical_range_mv * self._vertical_offset_in_percent)
-        return 1e-3 * (
-            float(self._vertical_range_mv) * raw_waveform / float(self._full_scale_value) + vertical_offset_mv
-        )
+    def convert_raw_waveform_to_voltage_waveform(
+        self, raw_waveform: ndarray, data_type: Type[floating] = float64
+    ) -> NDArray[floating]:
+        """Convert a waveform of raw ADC counts acquired by this channel into Volts.
+
+        Args:
+            raw_waveform (ndarray): Raw samples acquired by this channel.
+            data_type (Type[floating]): The floating point type of the returned waveform. Defaults to float64. float32 is
+                sufficient to represent samples from 16-bit (or smaller) ADCs, and halves the memory used.
+
+        Returns:
+            voltage_waveform (NDArray[floating]): The waveform in Volts, with dtype data_type.
+        """
+        voltage_waveform: NDArray[floating] = multiply(raw_waveform, data_type(self._voltage_gain), dtype=data_type)
+        voltage_waveform += data_type(self._voltage_offset)
+        return voltage_waveform
+
+    def _get_voltage_gain_and_offset(self) -> Tuple[float, float]:
+        """The gain (V per ADC count) and offset (V) which convert raw samples from this channel into Volts."""
+        return self._voltage_gain, self._voltage_offset
+
+    def _update_voltage_conversion(self) -> None:
+        """Recompute the voltage gain and offset. Must be called whenever the stored vertical range or offset
+        changes."""
+        self._voltage_gain = 1e-3 * float(self._vertical_range_mv) / float(self._full_scale_value)
+        self._voltage_offset = 1e-5 * float(self._vertical_range_mv * self._vertical_offset_in_percent)
 
     @property
     def vertical_range_in_mv(self) -> int:
@@ -92,9 +123,8 @@ class SpectrumDigitiserAnalogChannel(AbstractSpectrumAnalogChannel, SpectrumDigi
         Returns:
             vertical_range (int): The currently set vertical range in mV.
         """
-        self._vertical_range_mv = self._parent_device.read_spectrum_device_register(
-            VERTICAL_RANGE_COMMANDS[self._number]
-        )
+        self._vertical_range_mv = self._parent_card._read_cached_register(VERTICAL_RANGE_COMMANDS[self._number])
+        self._update_voltage_conversion()
         return self._vertical_range_mv
 
     def set_vertical_range_in_mv(self, vertical_range: int) -> None:
@@ -103,8 +133,9 @@ class SpectrumDigitiserAnalogChannel(AbstractSpectrumAnalogChannel, SpectrumDigi
         Args:
             vertical_range (int): The desired vertical range in mV.
         """
-        self._parent_device.write_to_spectrum_device_register(VERTICAL_RANGE_COMMANDS[self._number], vertical_range)
+        self._parent_card._write_to_cached_register(VERTICAL_RANGE_COMMANDS[self._number], vertical_range)
         self._vertical_range_mv = vertical_range
+        self._update_voltage_conversion()
 
     @property
     def vertical_offset_in_percent(self) -> int:
@@ -113,9 +144,10 @@ class SpectrumDigitiserAnalogChannel(AbstractSpectrumAnalogChannel, SpectrumDigi
         Returns:
             offset (int): The currently set vertical offset in percent.
         """
-        self._vertical_offset_in_percent = self._parent_device.read_spectrum_device_register(
+        self._vertical_offset_in_percent = self._parent_card._read_cached_register(
             VERTICAL_OFFSET_COMMANDS[self._number]
         )
+        self._update_voltage_conversion()
         return self._vertical_offset_in_percent
 
     def set_vertical_offset_in_percent(self, offset: int) -> None:
@@ -125,8 +157,9 @@ class SpectrumDigitiserAnalogChannel(AbstractSpectrumAnalogChannel, SpectrumDigi
         Args:
             offset (int): The desired vertical offset in percent.
         """
-        self._parent_device.write_to_spectrum_device_register(VERTICAL_OFFSET_COMMANDS[self._number], offset)
+        self._parent_card._write_to_cached_register(VERTICAL_OFFSET_COMMANDS[self._number], offset)
         self._vertical_offset_in_percent = offset
+        self._update_voltage_conversion()
 
     @property
     def input_impedance(self) -> InputImpedance:
@@ -6,9 +6,10 @@
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Sequence, Type
 
-from numpy import ndarray
+from numpy import float64, floating, ndarray
+from numpy.typing import NDArray
 
 from spectrumdevice.devices.abstract_device.device_interface import SpectrumDeviceInterface
 from spectrumdevice.devices.abstract_device.channel_interfaces import (
@@ -48,7 +49,9 @@ class SpectrumDigitiserAnalogChannelInterface(SpectrumAnalogChannelInterface, AB
         raise NotImplementedError()
 
     @abstractmethod
-    def convert_raw_waveform_to_voltage_waveform(self, raw_waveform: ndarray) -> ndarray:
+    def convert_raw_waveform_to_voltage_waveform(
+        self, raw_waveform: ndarray, data_type: Type[floating] = float64
+    ) -> NDArray[floating]:
         raise NotImplementedError()
 
     @property
@@ -116,6 +119,10 @@ class SpectrumDigitiserInterface(SpectrumDeviceInterface, ABC):
     def get_timestamp(self) -> Optional[datetime]:
         raise NotImplementedError()
 
+    @abstractmethod
+    def get_timestamp_ns(self) -> Optional[int]:
+        raise NotImplementedError()
+
     @abstractmethod
     def enable_timestamping(self) -> None:
         raise NotImplementedError()
@@ -155,3 +162,11 @@ class SpectrumDigitiserInterface(SpectrumDeviceInterface, ABC):
     @abstractmethod
     def set_batch_size(self, batch_size: int) -> None:
         raise NotImplementedError()
+
+    @abstractmethod
+    def set_vertical_ranges_in_mv(self, vertical_ranges: Sequence[int], channel_nums: Sequence[int]) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def set_vertical_offsets_in_percent(self, offsets: Sequence[int], channel_nums: Sequence[int]) -> None:
+        raise NotImplementedError()
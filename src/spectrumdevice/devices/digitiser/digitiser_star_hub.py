@@ -4,8 +4,7 @@
 # Copyright (c) 2024 School of Biomedical Engineering & Imaging Sciences, King's College London
 # Licensed under the MIT. You may obtain a copy at https://opensource.org/licenses/MIT.
 import datetime
-from threading import Thread
-from typing import Callable, Dict, List, Optional, Sequence, TypeVar
+from typing import Callable, List, Optional, Sequence, Tuple, TypeVar
 
 from numpy import float64, int16
 from numpy.typing import NDArray
@@ -70,8 +69,7 @@ class SpectrumDigitiserStarHub(
     def wait_for_acquisition_to_complete(self) -> None:
         """Wait for each card to finish its acquisition. See `SpectrumDigitiserCard.wait_for_acquisition_to_complete()`
         for more information."""
-        for card in self._child_cards:
-            card.wait_for_acquisition_to_complete()
+        self._run_on_child_cards(lambda card: card.wait_for_acquisition_to_complete())
 
     def get_waveforms(self) -> List[List[NDArray[float64]]]:
         """Get a list of the most recently transferred waveforms, as floating point voltages.
@@ -100,26 +98,14 @@ class SpectrumDigitiserStarHub(
     def _get_waveforms_in_threads(
         self, get_waveforms_method: Callable[[SpectrumDigitiserCard], List[List[WAVEFORM_TYPE_VAR]]]
     ) -> List[List[WAVEFORM_TYPE_VAR]]:
-        """Gets waveforms from child cards in separate threads, using the SpectrumDigitiserCard method provided."""
-
-        card_ids_and_waveform_sets: Dict[str, list[list[WAVEFORM_TYPE_VAR]]] = {}
-
-        def _get_waveforms(digitiser_card: SpectrumDigitiserCard) -> None:
-            this_cards_waveforms = get_waveforms_method(digitiser_card)
-            card_ids_and_waveform_sets[str(digitiser_card)] = this_cards_waveforms
-
-        threads = [Thread(target=_get_waveforms, args=(card,)) for card in self._child_cards]
-
-        for thread in threads:
-            thread.start()
-        for thread in threads:
-            thread.join()
+        """Gets waveforms from child cards concurrently, using the SpectrumDigitiserCard method provided."""
+        waveform_sets_by_card = self._run_on_child_cards(get_waveforms_method)
 
         waveform_sets_all_cards_ordered = []
         for n in range(self.batch_size):
             waveforms_in_this_batch = []
-            for card in self._child_cards:
-                waveforms_in_this_batch += card_ids_and_waveform_sets[str(card)][n]
+            for card_waveform_sets in waveform_sets_by_card:
+                waveforms_in_this_batch += card_waveform_sets[n]
             waveform_sets_all_cards_ordered.append(waveforms_in_this_batch)
 
         return waveform_sets_all_cards_ordered
@@ -128,6 +114,10 @@ class SpectrumDigitiserStarHub(
         """Get timestamp for the last acquisition"""
         return self._triggering_card.get_timestamp()
 
+    def get_timestamp_ns(self) -> Optional[int]:
+        """Get timestamp for the last acquisition, as an integer number of nanoseconds since the epoch"""
+        return self._triggering_card.get_timestamp_ns()
+
     def enable_timestamping(self) -> None:
         self._triggering_card.enable_timestamping()
 
@@ -139,10 +129,9 @@ class SpectrumDigitiserStarHub(
 
         Returns:
             length_in_samples: The currently set acquisition length in samples."""
-        lengths = []
-        for d in self._child_cards:
-            lengths.append(d.acquisition_length_in_samples)
-        return check_settings_constant_across_devices(lengths, __name__)
+        return check_settings_constant_across_devices(
+            (card.acquisition_length_in_samples for card in self._child_cards), __name__
+        )
 
     def set_acquisition_length_in_samples(self, length_in_samples: int) -> None:
         """Set a new recording length for all child cards. See `SpectrumDigitiserCard.set_acquisition_length_in_samples()`
@@ -162,10 +151,9 @@ class SpectrumDigitiserStarHub(
         Returns:
             length_in_samples (int): The current post trigger length in samples.
         """
-        lengths = []
-        for d in self._child_cards:
-            lengths.append(d.post_trigger_length_in_samples)
-        return check_settings_constant_across_devices(lengths, __name__)
+        return check_settings_constant_across_devices(
+            (card.post_trigger_length_in_samples for card in self._child_cards), __name__
+        )
 
     def set_post_trigger_length_in_samples(self, length_in_samples: int) -> None:
         """Set a new post trigger length for all child cards. See `SpectrumDigitiserCard.set_post_trigger_length_in_samples()`
@@ -185,10 +173,11 @@ class SpectrumDigitiserStarHub(
         Returns:
             mode (`AcquisitionMode`): The currently enabled acquisition mode.
         """
-        modes = []
-        for d in self._child_cards:
-            modes.append(d.acquisition_mode)
-        return AcquisitionMode(check_settings_constant_across_devices([m.value for m in modes], __name__))
+        return AcquisitionMode(
+            check_settings_constant_across_devices(
+                (card.acquisition_mode.value for card in self._child_cards), __name__
+            )
+        )
 
     def set_acquisition_mode(self, mode: AcquisitionMode) -> None:
         """Change the acquisition mode for all child cards. See `SpectrumDigitiserCard.set_acquisition_mode()` for more
@@ -201,15 +190,74 @@ class SpectrumDigitiserStarHub(
 
     @property
     def batch_size(self) -> int:
-        batch_sizes = []
-        for d in self._child_cards:
-            batch_sizes.append(d.batch_size)
-        return check_settings_constant_across_devices(batch_sizes, __name__)
+        return check_settings_constant_across_devices((card.batch_size for card in self._child_cards), __name__)
 
     def set_batch_size(self, batch_size: int) -> None:
         for d in self._child_cards:
             d.set_batch_size(batch_size)
 
+    def set_vertical_ranges_in_mv(self, vertical_ranges: Sequence[int], channel_nums: Sequence[int]) -> None:
+        """Set the input ranges of several channels in mV, indexed over the whole hub. The registers of each child card
+        are written in a single pass. See `SpectrumDigitiserCard.set_vertical_ranges_in_mv()` for more information.
+
+        Args:
+            vertical_ranges (Sequence[int]): The desired vertical ranges in mV, one per channel in channel_nums.
+            channel_nums (Sequence[int]): The indices of the channels to configure, from 0 to N-1, where N is the total
+                number of channels available to the hub.
+
+        Raises:
+            ValueError: If vertical_ranges and channel_nums have different lengths, or a channel number is not a
+                channel of the hub. Nothing is written in either case.
+        """
+        for card, card_channel_nums, card_values in self._split_channel_values_by_card(channel_nums, vertical_ranges):
+            card.set_vertical_ranges_in_mv(card_values, card_channel_nums)
+
+    def set_vertical_offsets_in_percent(self, offsets: Sequence[int], channel_nums: Sequence[int]) -> None:
+        """Set the input offsets of several channels in percent of their vertical ranges, indexed over the whole hub.
+        The registers of each child card are written in a single pass. See
+        `SpectrumDigitiserCard.set_vertical_offsets_in_percent()` for more information.
+
+        Args:
+            offsets (Sequence[int]): The desired vertical offsets in percent, one per channel in channel_nums.
+            channel_nums (Sequence[int]): The indices of the channels to configure, from 0 to N-1, where N is the total
+                number of channels available to the hub.
+
+        Raises:
+            ValueError: If offsets and channel_nums have different lengths, or a channel number is not a channel of the
+                hub. Nothing is written in either case.
+        """
+        for card, card_channel_nums, card_values in self._split_channel_values_by_card(channel_nums, offsets):
+            card.set_vertical_offsets_in_percent(card_values, card_channel_nums)
+
+    def _split_channel_values_by_card(
+        self, channel_nums: Sequence[int], values: Sequence[int]
+    ) -> List[Tuple[SpectrumDigitiserCard, List[int], List[int]]]:
+        """Converts hub channel indices into per-card channel indices, grouping the corresponding values by card. Cards
+        with no channels in channel_nums are left out. Raises ValueError, before any card is configured, if there is not
+        one value per channel or if a channel number is not a channel of the hub."""
+        if len(values) != len(channel_nums):
+            raise ValueError(
+                f"{len(values)} values were provided for {len(channel_nums)} channels. Provide one value per channel."
+            )
+        num_channels = len(self.analog_channels)
+        invalid_channel_nums = [n for n in channel_nums if not 0 <= n < num_channels]
+        if invalid_channel_nums:
+            raise ValueError(f"{self} has {num_channels} channels, so {invalid_channel_nums} are not valid channels.")
+        split_by_card = []
+        n_channels_in_previous_cards = 0
+        for card in self._child_cards:
+            n_channels_in_card = len(card.analog_channels)
+            card_channel_nums = []
+            card_values = []
+            for channel_num, value in zip(channel_nums, values):
+                if n_channels_in_previous_cards <= channel_num < n_channels_in_previous_cards + n_channels_in_card:
+                    card_channel_nums.append(channel_num - n_channels_in_previous_cards)
+                    card_values.append(value)
+            if card_channel_nums:
+                split_by_card.append((card, card_channel_nums, card_values))
+            n_channels_in_previous_cards += n_channels_in_card
+        return split_by_card
+
     def force_trigger(self) -> None:
         for d in self._child_cards:
             d.force_trigger()
@@ -5,7 +5,6 @@
 # Licensed under the MIT. You may obtain a copy at https://opensource.org/licenses/MIT.
 
 import logging
-from time import perf_counter, sleep
 from typing import Any, List, Optional, Sequence
 
 from spectrumdevice.devices.awg.awg_card import SpectrumAWGCard
@@ -114,7 +113,8 @@ class MockSpectrumDigitiserCard(MockAbstractSpectrumDigitiser, MockAbstractSpect
             channels_nums (List[int]): List of mock channel indices to enable, e.g. [0, 1, 2].
 
         """
-        if len(list(filter(lambda x: 0 <= x < len(self.analog_channels), channels_nums))) == len(channels_nums):
+        num_channels = len(self.analog_channels)
+        if all(0 <= channel_num < num_channels for channel_num in channels_nums):
             super().set_enabled_analog_channels(channels_nums)
         else:
             raise SpectrumSettingsMismatchError("Not enough channels in mock device configuration.")
@@ -136,15 +136,14 @@ class MockSpectrumDigitiserCard(MockAbstractSpectrumDigitiser, MockAbstractSpect
 
     def wait_for_transfer_chunk_to_complete(self) -> None:
         """See `SpectrumDigitiserCard.wait_for_transfer_chunk_to_complete()`. This mock implementation blocks until a
-        new mock transfer has been completed by waiting for a change to TRANSFER_CHUNK_COUNTER."""
+        new mock transfer has been completed by waiting for a change to TRANSFER_CHUNK_COUNTER. The mock waveform source
+        notifies a condition after each transfer, so this method wakes as soon as one is completed rather than polling."""
         if self._transfer_buffer:
-            t0 = perf_counter()
-            t_elapsed = 0.0
-            while (
-                self._previous_transfer_chunk_count == self._param_dict[TRANSFER_CHUNK_COUNTER]
-            ) and t_elapsed < MOCK_TRANSFER_TIMEOUT_IN_S:
-                sleep(0.1)
-                t_elapsed = perf_counter() - t0
+            with self._transfer_chunk_condition:
+                self._transfer_chunk_condition.wait_for(
+                    lambda: self._previous_transfer_chunk_count != self._param_dict[TRANSFER_CHUNK_COUNTER],
+                    timeout=MOCK_TRANSFER_TIMEOUT_IN_S,
+                )
             self._previous_transfer_chunk_count = self._param_dict[TRANSFER_CHUNK_COUNTER]
         else:
             raise SpectrumNoTransferBufferDefined("No transfer in progress.")
@@ -237,11 +236,10 @@ class MockSpectrumDigitiserStarHub(MockAbstractSpectrumStarHub, SpectrumDigitise
         instruction to start acquisition, which they automatically relay to their child cards - hence why
         `start` is implemented in `AbstractSpectrumDevice` (base class to both `SpectrumDigitiserCard` and
         `SpectrumStarHub`) rather than in `SpectrumStarHub`. In this mock `implementation`, each card's acquisition is
-        started individually.
+        started individually, with the cards started concurrently in the hub's child card thread pool.
 
         """
-        for card in self._child_cards:
-            card.start()
+        self._run_on_child_cards(lambda card: card.start())
 
     def stop(self) -> None:
         """Stop a mock acquisition
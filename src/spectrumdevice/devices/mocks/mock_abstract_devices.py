@@ -4,11 +4,12 @@
 # Copyright (c) 2024 School of Biomedical Engineering & Imaging Sciences, King's College London
 # Licensed under the MIT. You may obtain a copy at https://opensource.org/licenses/MIT.
 
+import logging
 from abc import ABC
 from functools import reduce
 from operator import or_
-from threading import Event, Lock, Thread
-from typing import Any, Dict, Optional, Union, cast
+from threading import Condition, Event, Lock, Thread
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union, cast
 
 from spectrum_gmbh.py_header.regs import (
     SPCM_X0_AVAILMODES,
@@ -111,6 +112,8 @@ from spectrumdevice.settings import (
 from spectrumdevice.settings.card_dependent_properties import CardType
 from spectrumdevice.settings.device_modes import GenerationMode
 
+logger = logging.getLogger(__name__)
+
 
 class MockAbstractSpectrumDevice(AbstractSpectrumDevice, ABC):
     def __init__(self, param_dict: Optional[Dict[int, int]], **kwargs: Any):
@@ -137,11 +140,28 @@ class MockAbstractSpectrumDevice(AbstractSpectrumDevice, ABC):
                 documentation for the register being set to determine the length to use. Default is 32 bit which is
                 correct for the majority of cases.
         """
-        if self.connected:
+        if self._connected:
             self._param_dict[spectrum_register] = value
         else:
             raise SpectrumDeviceNotConnected("Mock device has been disconnected.")
 
+    def write_to_spectrum_device_registers(
+        self,
+        register_values: Sequence[Tuple[int, int]],
+        length: SpectrumRegisterLength = SpectrumRegisterLength.THIRTY_TWO,
+    ) -> None:
+        """Simulates the setting of several parameters or commands (registers) on Spectrum hardware by storing their
+        values internally.
+
+        Args:
+            register_values (Sequence[Tuple[int, int]]): (register, value) pairs to set.
+            length (`SpectrumRegisterLength`): Length in bits of the registers being set.
+        """
+        if self._connected:
+            self._param_dict.update(register_values)
+        else:
+            raise SpectrumDeviceNotConnected("Mock device has been disconnected.")
+
     def read_spectrum_device_register(
         self, spectrum_register: int, length: SpectrumRegisterLength = SpectrumRegisterLength.THIRTY_TWO
     ) -> int:
@@ -162,16 +182,36 @@ class MockAbstractSpectrumDevice(AbstractSpectrumDevice, ABC):
             value (int): The value of the requested register.
 
         """
-        if self.connected:
-            if spectrum_register in self._param_dict:
+        if self._connected:
+            try:
                 return self._param_dict[spectrum_register]
-            else:
+            except KeyError:
                 raise MockRegisterNotImplemented(
                     f"Register {spectrum_register} has not been implemented in the mock device."
                 )
         else:
             raise SpectrumDeviceNotConnected("Mock device has been disconnected.")
 
+    def read_spectrum_device_registers(
+        self, spectrum_registers: Sequence[int], length: SpectrumRegisterLength = SpectrumRegisterLength.THIRTY_TWO
+    ) -> List[int]:
+        """Read the current values of several mock Spectrum registers. See `read_spectrum_device_register()`.
+
+        Args:
+            spectrum_registers (Sequence[int]): Mock spectrum device registers to read.
+            length (`SpectrumRegisterLength`): Length in bits of the registers being read.
+
+        Returns:
+            values (List[int]): The values of the requested registers, in the order they were given.
+        """
+        if self._connected:
+            try:
+                return [self._param_dict[spectrum_register] for spectrum_register in spectrum_registers]
+            except KeyError as e:
+                raise MockRegisterNotImplemented(f"Register {e.args[0]} has not been implemented in the mock device.")
+        else:
+            raise SpectrumDeviceNotConnected("Mock device has been disconnected.")
+
 
 class MockAbstractSpectrumCard(MockAbstractSpectrumDevice, AbstractSpectrumCard, ABC):
     """Overrides methods of `AbstractSpectrumDevice` that communicate with hardware with mocked implementations, allowing
@@ -293,6 +333,31 @@ class MockAbstractSpectrumCard(MockAbstractSpectrumDevice, AbstractSpectrumCard,
         )  # then call the rest of the inits after the params have been set
         self._visa_string = "/mock" + self._visa_string
 
+    # MockAbstractSpectrumDevice's register writers precede AbstractSpectrumCard's in the MRO, so these overrides keep
+    # the card's register cache consistent with the mock registers, as AbstractSpectrumCard's writers do for hardware.
+
+    def write_to_spectrum_device_register(
+        self, spectrum_register: int, value: int, length: SpectrumRegisterLength = SpectrumRegisterLength.THIRTY_TWO
+    ) -> None:
+        """See `MockAbstractSpectrumDevice.write_to_spectrum_device_register()` and
+        `AbstractSpectrumCard.write_to_spectrum_device_register()`."""
+        try:
+            super().write_to_spectrum_device_register(spectrum_register, value, length)
+        finally:
+            self._discard_cached_registers((spectrum_register,))
+
+    def write_to_spectrum_device_registers(
+        self,
+        register_values: Sequence[Tuple[int, int]],
+        length: SpectrumRegisterLength = SpectrumRegisterLength.THIRTY_TWO,
+    ) -> None:
+        """See `MockAbstractSpectrumDevice.write_to_spectrum_device_registers()` and
+        `AbstractSpectrumCard.write_to_spectrum_device_registers()`."""
+        try:
+            super().write_to_spectrum_device_registers(register_values, length)
+        finally:
+            self._discard_cached_registers(register for register, _ in register_values)
+
 
 class MockAbstractSpectrumStarHub(MockAbstractSpectrumDevice, AbstractSpectrumStarHub, ABC):
     pass
@@ -315,6 +380,7 @@ class MockAbstractSpectrumDigitiser(MockAbstractSpectrumDevice, AbstractSpectrum
         self._source_frame_rate_hz = mock_source_frame_rate_hz
         self._buffer_lock = Lock()
         self._acquisition_stop_event = Event()
+        self._transfer_chunk_condition = Condition()  # notified by the mock waveform source after each transfer chunk
         self._acquisition_thread: Optional[Thread] = None
         self._timestamp_thread: Optional[Thread] = None
         self._enabled_channels = [0]
@@ -325,9 +391,11 @@ class MockAbstractSpectrumDigitiser(MockAbstractSpectrumDevice, AbstractSpectrum
         """
         self.define_transfer_buffer()
         notify_size = self.transfer_buffers[0].notify_size_in_pages  # this will be 0 in STD_SINGLE_MODE
-        waveform_source = mock_waveform_source_factory(self.acquisition_mode, self._param_dict, notify_size)
+        waveform_source = mock_waveform_source_factory(
+            self.acquisition_mode, self._param_dict, self._transfer_chunk_condition, notify_size
+        )
         amplitude = self.read_spectrum_device_register(SPC_MIINST_MAXADCVALUE)
-        print(f"STARTING MOCK WAVEFORMS SOURCE WITH AMPLITUDE {amplitude}")
+        logger.debug(f"Starting mock waveform source with amplitude {amplitude}")
         self._acquisition_stop_event.clear()
         self._acquisition_thread = Thread(
             target=waveform_source,
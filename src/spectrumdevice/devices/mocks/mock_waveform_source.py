@@ -5,12 +5,11 @@
 # Licensed under the MIT. You may obtain a copy at https://opensource.org/licenses/MIT.
 
 from abc import ABC, abstractmethod
-from threading import Event, Lock
-from time import monotonic, sleep
+from threading import Condition, Event, Lock
 from typing import Dict
 
-from numpy import ndarray
-from numpy.random import uniform
+from numpy import empty, float64, ndarray
+from numpy.random import default_rng
 
 from spectrum_gmbh.py_header.regs import SPC_DATA_AVAIL_USER_LEN, SPC_DATA_AVAIL_USER_POS
 from spectrumdevice.settings import AcquisitionMode
@@ -18,14 +17,36 @@ from spectrumdevice.settings.transfer_buffer import PAGE_SIZE_IN_BYTES
 
 
 TRANSFER_CHUNK_COUNTER = -1  # this is a custom key used in the _para_dict to count the number of transfers
+NUM_TRANSFER_CHUNKS_PER_NOISE_BATCH = 16  # FIFO mode sources generate noise for this many transfer chunks at a time
 
 
 class MockWaveformSource(ABC):
     """Interface for a mock noise waveform source. Implementations are intended to be called in their own thread.
     When called, `MockWaveformSource` implementations will fill a provided buffer with noise samples."""
 
-    def __init__(self, param_dict: Dict[int, int]):
+    def __init__(
+        self, param_dict: Dict[int, int], transfer_chunk_condition: Condition, num_fills_per_noise_batch: int = 1
+    ):
         self._param_dict = param_dict
+        self._transfer_chunk_condition = transfer_chunk_condition
+        self._rng = default_rng()
+        self._num_fills_per_noise_batch = num_fills_per_noise_batch
+        self._noise_buffer = empty(0, dtype=float64)
+        self._noise_buffer_position = 0
+
+    def _fill_with_noise(self, samples: ndarray, amplitude: float) -> None:
+        """Fills samples in place with uniformly distributed noise in the range -amplitude to +amplitude. Noise is
+        generated in batches large enough for several fills, into a buffer that is kept between calls, so the random
+        number generator is called once per batch and no new arrays are allocated once the buffer is large enough."""
+        if self._noise_buffer.size - self._noise_buffer_position < samples.size:
+            if self._noise_buffer.size < samples.size:
+                self._noise_buffer = empty(samples.size * self._num_fills_per_noise_batch, dtype=float64)
+            self._rng.random(out=self._noise_buffer)
+            self._noise_buffer *= 2 * amplitude
+            self._noise_buffer -= amplitude
+            self._noise_buffer_position = 0
+        samples[:] = self._noise_buffer[self._noise_buffer_position : self._noise_buffer_position + samples.size]
+        self._noise_buffer_position += samples.size
 
     @abstractmethod
     def __call__(
@@ -58,27 +79,27 @@ class SingleModeMockWaveformSource(MockWaveformSource):
             frame_rate (float): The samples will be generated 1 / frame_rate seconds after __call__ is called.
             amplitude (float): Waveforms will contain random values in the range -amplitude to +amplitude
             on_device_buffer (ndarray): The numpy array into which the noise samples will be written.
-            buffer_lock (Lock): A threading lock created in the calling thread that will be used to ensure access to
-                the on_device_buffer array is thread safe.
+            buffer_lock (Lock): A threading lock created in the calling thread, held while the position and length of
+                newly available samples are updated.
 
         """
-        start_time = monotonic()
         bytes_per_sample = transfer_buffer_data_array.itemsize
-        while not stop_flag.is_set() and ((monotonic() - start_time) < (1 / frame_rate)):
-            sleep(0.001)
-        if not stop_flag.is_set():
+        # wait() returns True early if the stop flag is set, and False once the frame period has elapsed
+        if not stop_flag.wait(timeout=1 / frame_rate):
+            self._fill_with_noise(transfer_buffer_data_array[:samples_per_frame], amplitude)
             with buffer_lock:
-                transfer_buffer_data_array[:samples_per_frame] = uniform(
-                    low=-1 * amplitude, high=amplitude, size=samples_per_frame
-                )
                 self._param_dict[SPC_DATA_AVAIL_USER_POS] = 0
                 self._param_dict[SPC_DATA_AVAIL_USER_LEN] = samples_per_frame * bytes_per_sample
-            self._param_dict[TRANSFER_CHUNK_COUNTER] += 1
+            with self._transfer_chunk_condition:
+                self._param_dict[TRANSFER_CHUNK_COUNTER] += 1
+                self._transfer_chunk_condition.notify_all()
 
 
 class MultiFIFOModeMockWaveformSource(MockWaveformSource):
-    def __init__(self, param_dict: Dict[int, int], notify_size_in_pages: float):
-        super().__init__(param_dict)
+    def __init__(self, param_dict: Dict[int, int], transfer_chunk_condition: Condition, notify_size_in_pages: float):
+        super().__init__(
+            param_dict, transfer_chunk_condition, num_fills_per_noise_batch=NUM_TRANSFER_CHUNKS_PER_NOISE_BATCH
+        )
         self._notify_size_in_pages = notify_size_in_pages
 
     def __call__(
@@ -99,15 +120,15 @@ class MultiFIFOModeMockWaveformSource(MockWaveformSource):
             amplitude (float): Waveforms will contain random values from a uniform distribution in the range -amplitude
             to +amplitude
             on_device_buffer (ndarray): The numpy array into which the noise samples will be written.
-            buffer_lock (Lock): A threading lock created in the calling thread that will be used to ensure access to
-                the on_device_buffer array is thread safe.
+            buffer_lock (Lock): A threading lock created in the calling thread, held while the position and length of
+                newly available samples are updated.
 
         """
         bytes_per_sample = transfer_buffer_data_array.itemsize
         notify_size_in_samples = int(self._notify_size_in_pages * PAGE_SIZE_IN_BYTES / bytes_per_sample)
         notify_size_in_samples = min((samples_per_frame, notify_size_in_samples))
         samples_per_second = frame_rate * samples_per_frame
-        notify_sizes_per_second = samples_per_second / notify_size_in_samples
+        transfer_chunk_period_in_s = notify_size_in_samples / samples_per_second
         sample_count = 0
         while not stop_flag.is_set():
 
@@ -115,26 +136,27 @@ class MultiFIFOModeMockWaveformSource(MockWaveformSource):
             start_sample = 0 if start_sample == 256 else start_sample
             stop_sample = (sample_count + notify_size_in_samples) % samples_per_frame
             stop_sample = stop_sample if stop_sample else samples_per_frame
+            self._fill_with_noise(transfer_buffer_data_array[start_sample:stop_sample], amplitude)
             with buffer_lock:
-                transfer_buffer_data_array[start_sample:stop_sample] = uniform(
-                    low=-1 * amplitude, high=amplitude, size=stop_sample - start_sample
-                )
                 self._param_dict[SPC_DATA_AVAIL_USER_POS] = start_sample * bytes_per_sample
                 self._param_dict[SPC_DATA_AVAIL_USER_LEN] = (stop_sample - start_sample) * bytes_per_sample
             sample_count += notify_size_in_samples
-            self._param_dict[TRANSFER_CHUNK_COUNTER] += 1
+            with self._transfer_chunk_condition:
+                self._param_dict[TRANSFER_CHUNK_COUNTER] += 1
+                self._transfer_chunk_condition.notify_all()
 
-            sleep(1 / notify_sizes_per_second)
+            stop_flag.wait(timeout=transfer_chunk_period_in_s)
 
 
 def mock_waveform_source_factory(
     acquisition_mode: AcquisitionMode,
     param_dict: Dict[int, int],
+    transfer_chunk_condition: Condition,
     notify_size_in_pages: float = 0,
 ) -> MockWaveformSource:
     if acquisition_mode in (AcquisitionMode.SPC_REC_FIFO_MULTI, AcquisitionMode.SPC_REC_FIFO_AVERAGE):
-        return MultiFIFOModeMockWaveformSource(param_dict, notify_size_in_pages)
+        return MultiFIFOModeMockWaveformSource(param_dict, transfer_chunk_condition, notify_size_in_pages)
     elif acquisition_mode == AcquisitionMode.SPC_REC_STD_SINGLE:
-        return SingleModeMockWaveformSource(param_dict)
+        return SingleModeMockWaveformSource(param_dict, transfer_chunk_condition)
     else:
         raise NotImplementedError(f"Mock waveform source not yet implemented for {acquisition_mode} acquisition mode.")
@@ -5,6 +5,7 @@
 # Licensed under the MIT. You may obtain a copy at https://opensource.org/licenses/MIT.
 
 import datetime
+from time import time_ns
 
 from numpy import uint64
 
@@ -30,3 +31,6 @@ class MockTimestamper(Timestamper):
 
     def get_timestamp(self) -> datetime.datetime:
         return datetime.datetime.now()
+
+    def get_timestamp_ns(self) -> int:
+        return time_ns()
@@ -6,8 +6,8 @@
 
 import struct
 from abc import ABC
-from copy import copy
 from datetime import datetime, timedelta
+from time import time_ns
 from typing import Tuple, Optional
 
 from spectrum_gmbh.py_header.regs import (
@@ -54,6 +54,7 @@ class Timestamper(ABC):
         self._expected_timestamp_bytes_per_frame = BYTES_PER_TIMESTAMP
 
         self._ref_time: Optional[datetime] = None
+        self._ref_time_ns: Optional[int] = None
         self._configure_parent_device(parent_device_handle)
 
     def _configure_parent_device(self, handle: DEVICE_HANDLE_TYPE) -> None:
@@ -65,7 +66,8 @@ class Timestamper(ABC):
         self._parent_device.write_to_spectrum_device_register(SPC_M2CMD, M2CMD_CARD_WRITESETUP)
 
         # Set the local PC time to the reference time register on the card
-        self._ref_time = datetime.now()
+        self._ref_time_ns = time_ns()
+        self._ref_time = datetime.fromtimestamp(self._ref_time_ns / 1e9)
         self._parent_device.write_to_spectrum_device_register(SPC_TIMESTAMP_CMD, SPC_TS_RESET)
 
         # Enable polling mode so we can get the timestamps without waiting for a notification
@@ -81,13 +83,43 @@ class Timestamper(ABC):
 
     def get_timestamp(self) -> datetime:
 
-        trigger_source = self._parent_device.trigger_sources
-        if len(trigger_source) == 1 and trigger_source[0] == TriggerSource.SPC_TMASK_SOFTWARE:
+        if self._is_software_triggered():
             return datetime.now()
 
+        timestamp_in_seconds_since_ref = timedelta(
+            seconds=float(self._read_timestamp_in_samples()) / self._parent_device.sample_rate_in_hz
+        )
+
+        if self._ref_time is not None:
+            timestamp_in_datetime = self._ref_time + timestamp_in_seconds_since_ref
+        else:
+            raise IOError("No timestamp reference time has been set.")
+
+        return timestamp_in_datetime
+
+    def get_timestamp_ns(self) -> int:
+        """Get the timestamp of the last acquisition as an integer number of nanoseconds since the epoch, without
+        constructing a datetime. Convert with `datetime.fromtimestamp(timestamp_ns / 1e9)` when needed."""
+
+        if self._is_software_triggered():
+            return time_ns()
+
+        if self._ref_time_ns is None:
+            raise IOError("No timestamp reference time has been set.")
+
+        return (
+            self._ref_time_ns
+            + self._read_timestamp_in_samples() * 1_000_000_000 // self._parent_device.sample_rate_in_hz
+        )
+
+    def _is_software_triggered(self) -> bool:
+        trigger_source = self._parent_device.trigger_sources
+        return len(trigger_source) == 1 and trigger_source[0] == TriggerSource.SPC_TMASK_SOFTWARE
+
+    def _read_timestamp_in_samples(self) -> int:
         poll_count = 0
         n_kept_bytes = 0
-        kept_bytes = []
+        kept_bytes = bytearray()
 
         while (n_kept_bytes < self._expected_timestamp_bytes_per_frame) and (poll_count < MAX_POLL_COUNT):
 
@@ -105,9 +137,9 @@ class Timestamper(ABC):
                 n_bytes_to_keep = n_bytes_not_yet_received
 
             if n_bytes_to_keep > 0:
-                kept_bytes += list(
-                    copy(self._transfer_buffer.data_array[start_pos_int_bytes : start_pos_int_bytes + n_bytes_to_keep])
-                )
+                kept_bytes += self._transfer_buffer.data_array[
+                    start_pos_int_bytes : start_pos_int_bytes + n_bytes_to_keep
+                ].tobytes()
                 n_kept_bytes += len(kept_bytes)
                 self._mark_transfer_buffer_elements_as_free(len(kept_bytes))
 
@@ -116,14 +148,5 @@ class Timestamper(ABC):
         if n_kept_bytes < self._expected_timestamp_bytes_per_frame:
             raise SpectrumTimestampsPollingTimeout()
 
-        timestamp_in_samples = struct.unpack("<2Q", struct.pack(f"<{len(kept_bytes)}B", *kept_bytes))[0]
-        timestamp_in_seconds_since_ref = timedelta(
-            seconds=float(timestamp_in_samples) / self._parent_device.sample_rate_in_hz
-        )
-
-        if self._ref_time is not None:
-            timestamp_in_datetime = self._ref_time + timestamp_in_seconds_since_ref
-        else:
-            raise IOError("No timestamp reference time has been set.")
-
-        return timestamp_in_datetime
+        timestamp_in_samples: int = struct.unpack("<2Q", kept_bytes)[0]
+        return timestamp_in_samples
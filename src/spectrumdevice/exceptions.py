@@ -93,6 +93,10 @@ class SpectrumTimestampsPollingTimeout(IOError):
     pass
 
 
+class SpectrumStatusPollingTimeout(IOError):
+    pass
+
+
 class SpectrumWrongCardType(IOError):
     def __init__(self, detected_card_type: CardType) -> None:
         super().__init__(
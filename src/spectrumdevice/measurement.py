@@ -9,7 +9,7 @@ VoltageWaveformType = NDArray[float64]
 RawWaveformType = NDArray[int16]
 
 
-@dataclass
+@dataclass(slots=True)
 class Measurement:
     """Measurement is a dataclass for storing a set of waveforms generated by a single acquisition, with a timestamp."""
 
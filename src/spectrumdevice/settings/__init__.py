@@ -54,6 +54,7 @@ __all__ = [
     "DEVICE_STATUS_TYPE",
     "StatusCode",
     "SpectrumRegisterLength",
+    "WaitStrategy",
     "ModelNumber",
     "GenerationSettings",
     "OutputChannelFilter",
@@ -156,3 +157,23 @@ class SpectrumRegisterLength(Enum):
 
     def __repr__(self) -> str:
         return self.name
+
+
+class WaitStrategy(Enum):
+    """Enum defining how a device waits for an acquisition or a transfer to complete."""
+
+    INTERRUPT = 0
+    """Issue the blocking driver command, which sleeps until the card raises an interrupt. Uses no CPU while waiting."""
+    POLL = 1
+    """Repeatedly read the card status register until the awaited status bit is set, avoiding the interrupt and
+    context-switch latency at the cost of occupying a CPU core. If the device timeout elapses,
+    `SpectrumStatusPollingTimeout` is raised."""
+    HYBRID = 2
+    """Poll the card status register for a short time, then fall back to the blocking driver command."""
+
+    def __repr__(self) -> str:
+        return self.name
+
+
+DEFAULT_HYBRID_WAIT_SPIN_TIME_IN_US = 100
+"""The time for which a device using `WaitStrategy.HYBRID` polls before falling back to the blocking driver command."""
@@ -9,7 +9,7 @@ function for decoding the integer value received by a card when queried about it
 from enum import Enum
 from typing import List
 
-from spectrumdevice.spectrum_wrapper import decode_bitmap_using_list_of_ints
+from spectrumdevice.spectrum_wrapper import decode_bitmap_using_bit_table
 from spectrum_gmbh.py_header.regs import (
     M2STAT_NONE,
     M2STAT_CARD_PRETRIGGER,
@@ -54,7 +54,10 @@ DEVICE_STATUS_TYPE = List[CARD_STATUS_TYPE]
 hub and therefore contain multiple cards)."""
 
 
+# Every status code other than M2STAT_NONE is a single bit, so a status can be decoded by visiting only its set bits
+_STATUS_CODES_BY_BIT = {status.value: status for status in StatusCode if status.value != 0}
+
+
 def decode_status(code: int) -> CARD_STATUS_TYPE:
     """Converts the integer value received by a card when queried about its status to a list of StatusCodes."""
-    possible_codes = [code.value for code in StatusCode]
-    return [StatusCode(found_code) for found_code in decode_bitmap_using_list_of_ints(code, possible_codes)]
+    return decode_bitmap_using_bit_table(code, _STATUS_CODES_BY_BIT)
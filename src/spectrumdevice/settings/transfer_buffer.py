@@ -13,7 +13,7 @@ from enum import Enum
 from functools import partial
 from typing import Optional
 
-from numpy import ndarray, zeros, int16, uint8, int8
+from numpy import dtype, ndarray, zeros, int16, uint8, int8
 
 from spectrumdevice.spectrum_wrapper import DEVICE_HANDLE_TYPE
 from spectrumdevice.spectrum_wrapper.error_handler import error_handler
@@ -130,7 +130,7 @@ class TimestampsTransferBuffer(TransferBuffer):
             BufferType.SPCM_BUF_TIMESTAMP,
             direction,
             board_memory_offset_bytes,
-            zeros(PAGE_SIZE_IN_BYTES, dtype=uint8),
+            page_aligned_zeros(PAGE_SIZE_IN_BYTES, uint8),
             PAGE_SIZE_IN_BYTES,
         )
 
@@ -176,7 +176,10 @@ def transfer_buffer_factory(
     if buffer_type == BufferType.SPCM_BUF_DATA:
         if size_in_samples is not None:
             return SamplesTransferBuffer(
-                direction, board_memory_offset_bytes, zeros(size_in_samples, sample_data_type), notify_size_in_pages
+                direction,
+                board_memory_offset_bytes,
+                page_aligned_zeros(size_in_samples, sample_data_type),
+                notify_size_in_pages,
             )
         else:
             raise ValueError("You must provide a buffer size_in_samples to create a BufferType.SPCM_BUF_DATA buffer.")
@@ -186,6 +189,24 @@ def transfer_buffer_factory(
         raise NotImplementedError(f"TransferBuffer type {buffer_type} not yet supported.")
 
 
+def page_aligned_zeros(size: int, data_type: type) -> ndarray:
+    """Create a 1D array of zeros whose data starts on a page boundary, as recommended by Spectrum for the PC memory
+    used as a DMA transfer buffer.
+
+    Args:
+        size (int): The length of the array, in elements.
+        data_type (type): The numpy dtype of the array.
+
+    Returns:
+        array (ndarray): The page-aligned array of zeros.
+    """
+    size_in_bytes = size * dtype(data_type).itemsize
+    # Over-allocate by a page and slice from the first page boundary within the allocation
+    backing_array = zeros(size_in_bytes + PAGE_SIZE_IN_BYTES, dtype=uint8)
+    offset = -backing_array.ctypes.data % PAGE_SIZE_IN_BYTES
+    return backing_array[offset : offset + size_in_bytes].view(data_type)
+
+
 def _check_notify_size_validity(notify_size_in_pages: float) -> None:
 
     if notify_size_in_pages == 0:
@@ -230,5 +251,6 @@ def set_transfer_buffer(device_handle: DEVICE_HANDLE_TYPE, buffer: TransferBuffe
 
 
 DEFAULT_NOTIFY_SIZE_IN_PAGES = 10
+NUM_BATCHES_IN_FIFO_TRANSFER_BUFFER = 3
 PAGE_SIZE_IN_BYTES = 4096
 ALLOWED_FRACTIONAL_NOTIFY_SIZES_IN_PAGES = [1 / 2, 1 / 4, 1 / 8, 1 / 16, 1 / 32, 1 / 64, 1 / 128, 1 / 256]
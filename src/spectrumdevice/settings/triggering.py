@@ -9,7 +9,7 @@ received by a device when queried about its enabled trigger sources."""
 from enum import Enum
 from typing import List
 
-from spectrumdevice.spectrum_wrapper import decode_bitmap_using_list_of_ints
+from spectrumdevice.spectrum_wrapper import decode_bitmap_using_bit_table
 from spectrum_gmbh.py_header.regs import (
     SPC_TMASK0_CH0,
     SPC_TMASK0_CH1,
@@ -120,11 +120,15 @@ class ExternalTriggerMode(Enum):
     with one of the above modes."""
 
 
+# Every trigger source other than SPC_TMASK_NONE is a single bit, so a trigger source mask can be decoded by visiting
+# only its set bits
+_TRIGGER_SOURCES_BY_BIT = {source.value: source for source in TriggerSource if source.value != 0}
+
+
 def decode_trigger_sources(value: int) -> List[TriggerSource]:
     """Converts the integer values provided by a device when queried about its enabled trigger source to a list of
     TriggerSources."""
-    possible_values = [source.value for source in TriggerSource]
-    return [TriggerSource(found_value) for found_value in decode_bitmap_using_list_of_ints(value, possible_values)]
+    return decode_bitmap_using_bit_table(value, _TRIGGER_SOURCES_BY_BIT)
 
 
 EXTERNAL_TRIGGER_MODE_COMMANDS = {
@@ -6,7 +6,7 @@
 
 import logging
 from ctypes import c_void_p, byref, create_string_buffer
-from typing import NewType, List
+from typing import Any, Dict, List, NewType, TypeVar
 
 from spectrumdevice.spectrum_wrapper.error_handler import error_handler
 from spectrumdevice.exceptions import SpectrumIOError
@@ -42,6 +42,36 @@ except OSError:
     SPECTRUM_DRIVERS_FOUND = False
 
 DEVICE_HANDLE_TYPE = NewType("DEVICE_HANDLE_TYPE", c_void_p)
+BitmapMemberType = TypeVar("BitmapMemberType")
+
+
+def _declare_api_function_signatures() -> None:
+    """pyspcm.py assigns an `argtype` attribute (rather than `argtypes`) to the driver functions it loads, so ctypes
+    never sees their signatures and has to infer the C type of every argument on each call, passing Python ints as
+    32-bit C ints. Declaring the signatures of the functions used on the hot path means arguments are converted
+    directly to the types the driver expects (including 64-bit values for the _i64 functions)."""
+    from spectrum_gmbh import pyspcm
+
+    pyspcm.spcm_dwGetParam_i32.argtypes = [pyspcm.drv_handle, pyspcm.int32, pyspcm.ptr32]
+    pyspcm.spcm_dwGetParam_i32.restype = pyspcm.uint32
+    pyspcm.spcm_dwGetParam_i64.argtypes = [pyspcm.drv_handle, pyspcm.int32, pyspcm.ptr64]
+    pyspcm.spcm_dwGetParam_i64.restype = pyspcm.uint32
+    pyspcm.spcm_dwSetParam_i32.argtypes = [pyspcm.drv_handle, pyspcm.int32, pyspcm.int32]
+    pyspcm.spcm_dwSetParam_i32.restype = pyspcm.uint32
+    # On Windows, pyspcm wraps the ctypes function for spcm_dwSetParam_i64 in a Python function of the same name
+    set_param_i64_ctypes_function: Any = getattr(pyspcm, "spcm_dwSetParam_i64_", pyspcm.spcm_dwSetParam_i64)
+    set_param_i64_ctypes_function.argtypes = [pyspcm.drv_handle, pyspcm.int32, pyspcm.int64]
+    set_param_i64_ctypes_function.restype = pyspcm.uint32
+
+
+if SPECTRUM_DRIVERS_FOUND:
+    _declare_api_function_signatures()
+
+# The Spectrum API functions are wrapped in the error handler once, rather than on every call
+_checked_spcm_dwGetParam_i32 = error_handler(spcm_dwGetParam_i32)
+_checked_spcm_dwGetParam_i64 = error_handler(spcm_dwGetParam_i64)
+_checked_spcm_dwSetParam_i32 = error_handler(spcm_dwSetParam_i32)
+_checked_spcm_dwSetParam_i64 = error_handler(spcm_dwSetParam_i64)
 
 
 def decode_bitmap_using_list_of_ints(bitmap_value: int, test_values: List[int]) -> List[int]:
@@ -52,6 +82,23 @@ def decode_bitmap_using_list_of_ints(bitmap_value: int, test_values: List[int])
     return values_in_bitmap
 
 
+def decode_bitmap_using_bit_table(
+    bitmap_value: int, members_by_bit: Dict[int, BitmapMemberType]
+) -> List[BitmapMemberType]:
+    """Decodes a bitmap whose possible values are all single bits, visiting only the bits that are set rather than
+    testing every possible value. Set bits with no entry in members_by_bit are ignored. Members are returned in
+    ascending order of their bit values, matching decode_bitmap_using_list_of_ints()."""
+    remaining_bits = bitmap_value & 0xFFFFFFFFFFFFFFFF  # registers are at most 64 bits, and this bounds the loop
+    members = []
+    while remaining_bits:
+        lowest_set_bit = remaining_bits & -remaining_bits
+        member = members_by_bit.get(lowest_set_bit)
+        if member is not None:
+            members.append(member)
+        remaining_bits ^= lowest_set_bit
+    return members
+
+
 def toggle_bitmap_value(bitmap_value: int, option: int, enabled: bool) -> int:
     if enabled:
         return bitmap_value | option  # set relevant bit to one
@@ -61,22 +108,22 @@ def toggle_bitmap_value(bitmap_value: int, option: int, enabled: bool) -> int:
 
 def get_spectrum_i32_api_param(device_handle: DEVICE_HANDLE_TYPE, spectrum_command: int) -> int:
     param = int32(0)
-    error_handler(spcm_dwGetParam_i32)(device_handle, spectrum_command, byref(param))
+    _checked_spcm_dwGetParam_i32(device_handle, spectrum_command, byref(param))
     return param.value
 
 
 def get_spectrum_i64_api_param(device_handle: DEVICE_HANDLE_TYPE, spectrum_command: int) -> int:
     param = int64(0)
-    error_handler(spcm_dwGetParam_i64)(device_handle, spectrum_command, byref(param))
+    _checked_spcm_dwGetParam_i64(device_handle, spectrum_command, byref(param))
     return param.value
 
 
 def set_spectrum_i32_api_param(device_handle: DEVICE_HANDLE_TYPE, spectrum_command: int, value: int) -> None:
-    error_handler(spcm_dwSetParam_i32)(device_handle, spectrum_command, value)
+    _checked_spcm_dwSetParam_i32(device_handle, spectrum_command, value)
 
 
 def set_spectrum_i64_api_param(device_handle: DEVICE_HANDLE_TYPE, spectrum_command: int, value: int) -> None:
-    error_handler(spcm_dwSetParam_i64)(device_handle, spectrum_command, value)
+    _checked_spcm_dwSetParam_i64(device_handle, spectrum_command, value)
 
 
 def spectrum_handle_factory(visa_string: str) -> DEVICE_HANDLE_TYPE:  # type: ignore
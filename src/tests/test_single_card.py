@@ -5,23 +5,40 @@ from unittest import TestCase
 from numpy import array, iinfo, int16, zeros
 from numpy.testing import assert_array_equal
 
-from spectrum_gmbh.py_header.regs import SPC_CHENABLE
+from time import perf_counter
+
+from spectrum_gmbh.py_header.regs import (
+    M2CMD_CARD_WAITREADY,
+    M2STAT_CARD_READY,
+    SPC_CARDMODE,
+    SPC_CHENABLE,
+    SPC_M2CMD,
+    SPC_M2STATUS,
+    SPC_SAMPLERATE,
+    SPC_TIMEOUT,
+    SPC_TRIG_ANDMASK,
+)
 from spectrumdevice import SpectrumDigitiserAnalogChannel
 from spectrumdevice.devices.abstract_device.device_interface import SpectrumDeviceInterface
 from spectrumdevice.devices.awg.awg_channel import SpectrumAWGAnalogChannel
 from spectrumdevice.devices.awg.awg_interface import SpectrumAWGInterface
 from spectrumdevice.devices.digitiser import SpectrumDigitiserInterface
+from spectrumdevice.devices.mocks import MockSpectrumDigitiserCard
 from spectrumdevice.exceptions import (
     SpectrumDeviceNotConnected,
     SpectrumExternalTriggerNotEnabled,
+    SpectrumStatusPollingTimeout,
     SpectrumTriggerOperationNotImplemented,
 )
 from spectrumdevice.settings import (
     AcquisitionSettings,
+    ModelNumber,
     InputImpedance,
     GenerationSettings,
     OutputChannelFilter,
     OutputChannelStopLevelMode,
+    SpectrumRegisterLength,
+    WaitStrategy,
 )
 from spectrumdevice.settings.channel import SpectrumAnalogChannelName
 from spectrumdevice.settings.device_modes import AcquisitionMode, ClockMode, GenerationMode
@@ -30,10 +47,12 @@ from spectrumdevice.settings.transfer_buffer import (
     transfer_buffer_factory,
     BufferType,
     BufferDirection,
+    PAGE_SIZE_IN_BYTES,
 )
 from spectrumdevice.settings.triggering import ExternalTriggerMode, TriggerSource
 from tests.configuration import (
     ACQUISITION_LENGTH,
+    MOCK_DEVICE_TEST_FRAME_RATE_HZ,
     NUM_CHANNELS_PER_DIGITISER_MODULE,
     NUM_MODULES_PER_DIGITISER,
     NUM_MODULES_PER_AWG,
@@ -86,11 +105,27 @@ class SingleCardTest(TestCase, Generic[CardInterfaceVar], ABC):
         self._device.set_timeout_in_ms(1000)
         self.assertEqual(timeout, self._device.timeout_in_ms)
 
+    def test_write_to_multiple_registers(self) -> None:
+        self._device.write_to_spectrum_device_registers([(SPC_TIMEOUT, 2000), (SPC_TRIG_ANDMASK, 0)])
+        self.assertEqual(2000, self._device.read_spectrum_device_register(SPC_TIMEOUT))
+        self.assertEqual(0, self._device.read_spectrum_device_register(SPC_TRIG_ANDMASK))
+
+    def test_read_multiple_registers(self) -> None:
+        self._device.write_to_spectrum_device_registers([(SPC_TIMEOUT, 3000), (SPC_TRIG_ANDMASK, 0)])
+        self.assertEqual([3000, 0], self._device.read_spectrum_device_registers([SPC_TIMEOUT, SPC_TRIG_ANDMASK]))
+
     def test_trigger_sources(self) -> None:
         sources = [TriggerSource.SPC_TMASK_EXT0]
         self._device.set_trigger_sources(sources)
         self.assertEqual(sources, self._device.trigger_sources)
 
+    def test_trigger_sources_cannot_be_modified_through_lists(self) -> None:
+        sources = [TriggerSource.SPC_TMASK_EXT0]
+        self._device.set_trigger_sources(sources)
+        sources.append(TriggerSource.SPC_TMASK_SOFTWARE)
+        self._device.trigger_sources.append(TriggerSource.SPC_TMASK_SOFTWARE)
+        self.assertEqual([TriggerSource.SPC_TMASK_EXT0], self._device.trigger_sources)
+
     def test_external_trigger_mode(self) -> None:
         with self.assertRaises(SpectrumExternalTriggerNotEnabled):
             _ = self._device.external_trigger_mode
@@ -122,11 +157,30 @@ class SingleCardTest(TestCase, Generic[CardInterfaceVar], ABC):
         self._device.set_clock_mode(mode)
         self.assertEqual(mode, self._device.clock_mode)
 
+    def test_wait_strategy(self) -> None:
+        self.assertEqual(WaitStrategy.INTERRUPT, self._device.wait_strategy)
+        self._device.set_wait_strategy(WaitStrategy.HYBRID, hybrid_spin_time_in_us=50)
+        self.assertEqual(WaitStrategy.HYBRID, self._device.wait_strategy)
+
+    def test_negative_hybrid_spin_time(self) -> None:
+        with self.assertRaises(ValueError):
+            self._device.set_wait_strategy(WaitStrategy.HYBRID, hybrid_spin_time_in_us=-1)
+        self.assertEqual(WaitStrategy.INTERRUPT, self._device.wait_strategy)
+
     def test_sample_rate(self) -> None:
         rate = 20000000
         self._device.set_sample_rate_in_hz(rate)
         self.assertEqual(rate, self._device.sample_rate_in_hz)
 
+    def test_clock_mode_change_refreshes_sample_rate(self) -> None:
+        self._device.set_sample_rate_in_hz(20000000)
+        self.assertEqual(20000000, self._device.sample_rate_in_hz)
+        self._device.set_clock_mode(ClockMode.SPC_CM_INTPLL)
+        self._device.write_to_spectrum_device_register(SPC_SAMPLERATE, 10000000, SpectrumRegisterLength.SIXTY_FOUR)
+        self.assertEqual(10000000, self._device.sample_rate_in_hz)
+        self._device.set_sample_rate_in_hz(20000000)
+        self.assertEqual(20000000, self._device.sample_rate_in_hz)
+
     def test_features(self) -> None:
         try:
             feature_list = self._device.feature_list
@@ -187,12 +241,77 @@ class DigitiserCardTest(SingleCardTest[SpectrumDigitiserInterface]):
         self._device.set_acquisition_mode(acquisition_mode)
         self.assertEqual(acquisition_mode, self._device.acquisition_mode)
 
+    def test_direct_register_write_updates_cached_setting(self) -> None:
+        self._device.set_acquisition_mode(AcquisitionMode.SPC_REC_STD_SINGLE)
+        self.assertEqual(AcquisitionMode.SPC_REC_STD_SINGLE, self._device.acquisition_mode)
+        self._device.write_to_spectrum_device_register(SPC_CARDMODE, AcquisitionMode.SPC_REC_FIFO_MULTI.value)
+        self.assertEqual(AcquisitionMode.SPC_REC_FIFO_MULTI, self._device.acquisition_mode)
+
+    def test_setter_rewrites_value_changed_by_direct_write(self) -> None:
+        self._device.set_acquisition_mode(AcquisitionMode.SPC_REC_STD_SINGLE)
+        self.assertEqual(AcquisitionMode.SPC_REC_STD_SINGLE, self._device.acquisition_mode)
+        self._device.write_to_spectrum_device_register(SPC_CARDMODE, AcquisitionMode.SPC_REC_FIFO_MULTI.value)
+        self._device.set_acquisition_mode(AcquisitionMode.SPC_REC_STD_SINGLE)
+        self._device.refresh_cached_registers()
+        self.assertEqual(AcquisitionMode.SPC_REC_STD_SINGLE, self._device.acquisition_mode)
+
     def test_transfer_buffer(self) -> None:
         buffer = create_samples_acquisition_transfer_buffer(
             size_in_samples=ACQUISITION_LENGTH, bytes_per_sample=self._device.bytes_per_sample
         )
         self._device.define_transfer_buffer([buffer])
         self.assertEqual(buffer, self._device.transfer_buffers[0])
+        self.assertEqual(0, buffer.data_array.ctypes.data % PAGE_SIZE_IN_BYTES)
+        self.assertEqual(ACQUISITION_LENGTH, len(buffer.data_array))
+
+    def test_default_transfer_buffer_reused(self) -> None:
+        self._device.set_acquisition_mode(AcquisitionMode.SPC_REC_STD_SINGLE)
+        self._device.set_acquisition_length_in_samples(ACQUISITION_LENGTH)
+        self._device.define_transfer_buffer()
+        first_buffer = self._device.transfer_buffers[0]
+        self._device.define_transfer_buffer()
+        self.assertIs(first_buffer, self._device.transfer_buffers[0])
+        self._device.set_acquisition_length_in_samples(2 * ACQUISITION_LENGTH)
+        self._device.define_transfer_buffer()
+        self.assertIsNot(first_buffer, self._device.transfer_buffers[0])
+        self.assertEqual(2 * ACQUISITION_LENGTH, self._device.transfer_buffers[0].data_array.size)
+
+    def test_set_vertical_ranges_and_offsets(self) -> None:
+        self._device.set_vertical_ranges_in_mv([1000, 2000], [0, 1])
+        self._device.set_vertical_offsets_in_percent([10, 20], [0, 1])
+        self.assertEqual([1000, 2000], [channel.vertical_range_in_mv for channel in self._device.analog_channels[:2]])
+        self.assertEqual([10, 20], [channel.vertical_offset_in_percent for channel in self._device.analog_channels[:2]])
+
+    def test_set_vertical_ranges_and_offsets_with_mismatched_lengths(self) -> None:
+        with self.assertRaises(ValueError):
+            self._device.set_vertical_ranges_in_mv([1000], [0, 1])
+        with self.assertRaises(ValueError):
+            self._device.set_vertical_offsets_in_percent([10, 20], [0])
+
+    def test_set_vertical_ranges_with_invalid_channel_numbers(self) -> None:
+        channels = self._device.analog_channels
+        initial_ranges = [channel.vertical_range_in_mv for channel in channels]
+        for channel_nums in ([-1], [0, len(channels)]):
+            with self.assertRaises(ValueError):
+                self._device.set_vertical_ranges_in_mv([1000] * len(channel_nums), channel_nums)
+        self._device.refresh_cached_registers()
+        self.assertEqual(initial_ranges, [channel.vertical_range_in_mv for channel in channels])
+
+    def test_configure_acquisition_with_mismatched_impedances(self) -> None:
+        acquisition_settings = AcquisitionSettings(
+            acquisition_mode=AcquisitionMode.SPC_REC_STD_SINGLE,
+            sample_rate_in_hz=int(4e6),
+            acquisition_length_in_samples=400,
+            pre_trigger_length_in_samples=0,
+            timeout_in_ms=1000,
+            enabled_channels=[1],
+            vertical_ranges_in_mv=[1000],
+            vertical_offsets_in_percent=[10],
+            input_impedances=[],
+            timestamping_enabled=False,
+        )
+        with self.assertRaises(ValueError):
+            self._device.configure_acquisition(acquisition_settings)
 
     def test_configure_acquisition(self) -> None:
         channel_to_enable = 1
@@ -310,3 +429,88 @@ class AWGCardTest(SingleCardTest[SpectrumAWGInterface]):
         self.assertEqual(generation_settings.dc_offsets_in_mv[0], self._device.analog_channels[0].dc_offset_in_mv)
         self.assertEqual(generation_settings.output_filters[0], self._device.analog_channels[0].output_filter)
         self.assertEqual(generation_settings.stop_level_modes[0], self._device.analog_channels[0].stop_level_mode)
+
+
+class MockCardStatusWaitTest(TestCase):
+    """Tests the polling wait strategies against a mock card, whose status register is set directly."""
+
+    def setUp(self) -> None:
+        self._card = MockSpectrumDigitiserCard(
+            device_number=0,
+            model=ModelNumber.TYP_M2P5966_X4,
+            mock_source_frame_rate_hz=MOCK_DEVICE_TEST_FRAME_RATE_HZ,
+            num_modules=NUM_MODULES_PER_DIGITISER,
+            num_channels_per_module=NUM_CHANNELS_PER_DIGITISER_MODULE,
+        )
+        self._card.set_timeout_in_ms(200)
+        self._card.write_to_spectrum_device_register(SPC_M2CMD, 0)
+
+    def tearDown(self) -> None:
+        self._card.disconnect()
+
+    def _wait_for_card_ready(self) -> None:
+        self._card._wait_for_status(M2STAT_CARD_READY, M2CMD_CARD_WAITREADY)
+
+    def test_poll_returns_when_status_set(self) -> None:
+        self._card.set_wait_strategy(WaitStrategy.POLL)
+        self._card.write_to_spectrum_device_register(SPC_M2STATUS, M2STAT_CARD_READY)
+        self._wait_for_card_ready()
+        self.assertEqual(0, self._card.read_spectrum_device_register(SPC_M2CMD))
+
+    def test_poll_raises_after_one_timeout_when_status_unset(self) -> None:
+        self._card.set_wait_strategy(WaitStrategy.POLL)
+        self._card.write_to_spectrum_device_register(SPC_M2STATUS, 0)
+        start_time = perf_counter()
+        with self.assertRaises(SpectrumStatusPollingTimeout):
+            self._wait_for_card_ready()
+        self.assertLess(perf_counter() - start_time, 0.4)
+        self.assertEqual(0, self._card.read_spectrum_device_register(SPC_M2CMD))
+
+    def test_hybrid_returns_when_status_set(self) -> None:
+        self._card.set_wait_strategy(WaitStrategy.HYBRID, hybrid_spin_time_in_us=1000)
+        self._card.write_to_spectrum_device_register(SPC_M2STATUS, M2STAT_CARD_READY)
+        self._wait_for_card_ready()
+        self.assertEqual(0, self._card.read_spectrum_device_register(SPC_M2CMD))
+
+    def test_hybrid_falls_back_to_blocking_command_when_status_unset(self) -> None:
+        self._card.set_wait_strategy(WaitStrategy.HYBRID, hybrid_spin_time_in_us=1000)
+        self._card.write_to_spectrum_device_register(SPC_M2STATUS, 0)
+        self._wait_for_card_ready()
+        self.assertEqual(M2CMD_CARD_WAITREADY, self._card.read_spectrum_device_register(SPC_M2CMD))
+
+    def test_hybrid_with_no_spin_time_issues_blocking_command(self) -> None:
+        self._card.set_wait_strategy(WaitStrategy.HYBRID, hybrid_spin_time_in_us=0)
+        self._card.write_to_spectrum_device_register(SPC_M2STATUS, 0)
+        self._wait_for_card_ready()
+        self.assertEqual(M2CMD_CARD_WAITREADY, self._card.read_spectrum_device_register(SPC_M2CMD))
+
+
+class MockCardRegisterCacheTest(TestCase):
+    """Tests the register cache against a mock card, whose registers can be changed without going through the card
+    object, as another process could change the registers of a real card."""
+
+    def setUp(self) -> None:
+        self._card = MockSpectrumDigitiserCard(
+            device_number=0,
+            model=ModelNumber.TYP_M2P5966_X4,
+            mock_source_frame_rate_hz=MOCK_DEVICE_TEST_FRAME_RATE_HZ,
+            num_modules=NUM_MODULES_PER_DIGITISER,
+            num_channels_per_module=NUM_CHANNELS_PER_DIGITISER_MODULE,
+        )
+        self._card.set_acquisition_mode(AcquisitionMode.SPC_REC_STD_SINGLE)
+        self.assertEqual(AcquisitionMode.SPC_REC_STD_SINGLE, self._card.acquisition_mode)
+        self._card._param_dict[SPC_CARDMODE] = AcquisitionMode.SPC_REC_FIFO_MULTI.value
+
+    def tearDown(self) -> None:
+        self._card.disconnect()
+
+    def test_refresh_cached_registers(self) -> None:
+        self.assertEqual(AcquisitionMode.SPC_REC_STD_SINGLE, self._card.acquisition_mode)
+        self._card.refresh_cached_registers()
+        self.assertEqual(AcquisitionMode.SPC_REC_FIFO_MULTI, self._card.acquisition_mode)
+
+    def test_unchanged_settings_are_not_rewritten(self) -> None:
+        # the cached value shows that the mode is already set, so it is not written again
+        self._card.set_acquisition_mode(AcquisitionMode.SPC_REC_STD_SINGLE)
+        self._card.refresh_cached_registers()
+        self.assertEqual(AcquisitionMode.SPC_REC_FIFO_MULTI, self._card.acquisition_mode)
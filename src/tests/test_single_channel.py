@@ -1,11 +1,15 @@
 from unittest import TestCase
 
-from numpy import iinfo, int16
+from numpy import allclose, array, float32, float64, iinfo, int16
 
 from spectrumdevice import SpectrumDigitiserAnalogChannel
 from spectrumdevice.devices.awg.awg_channel import SpectrumAWGAnalogChannel
 from spectrumdevice.settings import InputImpedance
-from spectrumdevice.settings.channel import OutputChannelFilter, OutputChannelStopLevelMode
+from spectrumdevice.settings.channel import (
+    OutputChannelFilter,
+    OutputChannelStopLevelMode,
+    VERTICAL_RANGE_COMMANDS,
+)
 from tests.device_factories import create_awg_card_for_testing, create_digitiser_card_for_testing
 
 
@@ -22,6 +26,14 @@ class SingleDigitiserAnalogChannelTest(TestCase):
         self._channel.set_vertical_range_in_mv(v_range)
         self.assertEqual(v_range, self._channel.vertical_range_in_mv)
 
+    def test_vertical_range_follows_direct_register_writes(self) -> None:
+        self._channel.set_vertical_range_in_mv(1000)
+        self.assertEqual(1000, self._channel.vertical_range_in_mv)
+        self._device.write_to_spectrum_device_register(VERTICAL_RANGE_COMMANDS[0], 2000)
+        self.assertEqual(2000, self._channel.vertical_range_in_mv)
+        self._channel.set_vertical_range_in_mv(1000)
+        self.assertEqual(1000, self._channel.vertical_range_in_mv)
+
     def test_vertical_offset(self) -> None:
         offset = 1
         self._channel.set_vertical_offset_in_percent(offset)
@@ -32,6 +44,36 @@ class SingleDigitiserAnalogChannelTest(TestCase):
         self._channel.set_input_impedance(impedance)
         self.assertEqual(impedance, self._channel.input_impedance)
 
+    def test_invalid_channel_number(self) -> None:
+        for channel_number in (-1, 16):
+            with self.assertRaises(KeyError):
+                SpectrumDigitiserAnalogChannel(channel_number=channel_number, parent_device=self._device)
+
+    def test_channels_are_hashable(self) -> None:
+        same_channel = SpectrumDigitiserAnalogChannel(channel_number=0, parent_device=self._device)
+        other_channel = SpectrumDigitiserAnalogChannel(channel_number=1, parent_device=self._device)
+        self.assertEqual(self._channel, same_channel)
+        self.assertEqual(hash(self._channel), hash(same_channel))
+        self.assertEqual(2, len({self._channel, same_channel, other_channel}))
+
+    def test_channels_are_not_equal_to_other_objects(self) -> None:
+        self.assertNotEqual(self._channel, self._channel.name)
+        self.assertEqual(2, len({self._channel, self._channel.name}))
+        self.assertNotIn(self._channel, [self._channel.name])
+
+    def test_convert_raw_waveform_to_voltage_waveform(self) -> None:
+        self._channel.set_vertical_range_in_mv(1000)
+        self._channel.set_vertical_offset_in_percent(10)
+        full_scale = self._channel._full_scale_value
+        raw_waveform = array([0, full_scale, -full_scale], dtype=int16)
+        expected = array([0.1, 1.1, -0.9])
+        voltage_waveform = self._channel.convert_raw_waveform_to_voltage_waveform(raw_waveform)
+        self.assertEqual(float64, voltage_waveform.dtype)
+        self.assertTrue(allclose(expected, voltage_waveform))
+        voltage_waveform_32 = self._channel.convert_raw_waveform_to_voltage_waveform(raw_waveform, float32)
+        self.assertEqual(float32, voltage_waveform_32.dtype)
+        self.assertTrue(allclose(expected, voltage_waveform_32))
+
 
 class SingleAWGAnalogChannelTest(TestCase):
     def setUp(self) -> None:
@@ -1,10 +1,20 @@
+from threading import Event, enumerate as enumerate_threads
+from time import sleep
+from typing import List
+
 import pytest
 from numpy import array
 
-from spectrum_gmbh.py_header.regs import SPC_CHENABLE
-from spectrumdevice import SpectrumDigitiserAnalogChannel, SpectrumDigitiserStarHub
-from spectrumdevice.exceptions import SpectrumInvalidNumberOfEnabledChannels
-from spectrumdevice.settings import AcquisitionSettings, InputImpedance, AcquisitionMode
+from spectrum_gmbh.py_header.regs import SPC_CARDMODE, SPC_CHENABLE, SPC_SAMPLERATE
+from spectrumdevice import SpectrumDigitiserAnalogChannel, SpectrumDigitiserCard, SpectrumDigitiserStarHub
+from spectrumdevice.exceptions import SpectrumDeviceNotConnected, SpectrumInvalidNumberOfEnabledChannels
+from spectrumdevice.settings import (
+    AcquisitionSettings,
+    ClockMode,
+    InputImpedance,
+    AcquisitionMode,
+    SpectrumRegisterLength,
+)
 from spectrumdevice.settings.channel import SpectrumAnalogChannelName
 from spectrumdevice.settings.transfer_buffer import create_samples_acquisition_transfer_buffer
 from tests.configuration import (
@@ -33,6 +43,32 @@ class StarHubTest(DigitiserCardTest):
     def tearDown(self) -> None:
         self._device.disconnect()
 
+    def test_direct_register_write_updates_cached_setting(self) -> None:
+        self._device.set_acquisition_mode(AcquisitionMode.SPC_REC_STD_SINGLE)
+        self.assertEqual(AcquisitionMode.SPC_REC_STD_SINGLE, self._device.acquisition_mode)
+        for card in self._device._child_cards:
+            card.write_to_spectrum_device_register(SPC_CARDMODE, AcquisitionMode.SPC_REC_FIFO_MULTI.value)
+        self.assertEqual(AcquisitionMode.SPC_REC_FIFO_MULTI, self._device.acquisition_mode)
+
+    def test_setter_rewrites_value_changed_by_direct_write(self) -> None:
+        self._device.set_acquisition_mode(AcquisitionMode.SPC_REC_STD_SINGLE)
+        self.assertEqual(AcquisitionMode.SPC_REC_STD_SINGLE, self._device.acquisition_mode)
+        for card in self._device._child_cards:
+            card.write_to_spectrum_device_register(SPC_CARDMODE, AcquisitionMode.SPC_REC_FIFO_MULTI.value)
+        self._device.set_acquisition_mode(AcquisitionMode.SPC_REC_STD_SINGLE)
+        self._device.refresh_cached_registers()
+        self.assertEqual(AcquisitionMode.SPC_REC_STD_SINGLE, self._device.acquisition_mode)
+
+    def test_clock_mode_change_refreshes_sample_rate(self) -> None:
+        self._device.set_sample_rate_in_hz(20000000)
+        self.assertEqual(20000000, self._device.sample_rate_in_hz)
+        self._device.set_clock_mode(ClockMode.SPC_CM_INTPLL)
+        for card in self._device._child_cards:
+            card.write_to_spectrum_device_register(SPC_SAMPLERATE, 10000000, SpectrumRegisterLength.SIXTY_FOUR)
+        self.assertEqual(10000000, self._device.sample_rate_in_hz)
+        self._device.set_sample_rate_in_hz(20000000)
+        self.assertEqual(20000000, self._device.sample_rate_in_hz)
+
     def test_configure_acquisition(self) -> None:
         channels_to_enable = [0, 8]
         acquisition_settings = AcquisitionSettings(
@@ -135,3 +171,35 @@ class StarHubTest(DigitiserCardTest):
             self.assertTrue(False, f"raised an exception {e}")
             feature_list = []
         self.assertEqual(len(feature_list), NUM_CARDS_IN_STAR_HUB)
+
+    def test_child_card_exception_is_raised_after_other_cards_finish(self) -> None:
+        failing_card = self._device._child_cards[0]
+        finished_cards: List[SpectrumDigitiserCard] = []
+        failed = Event()
+
+        def wait_then_finish(card: SpectrumDigitiserCard) -> None:
+            if card is failing_card:
+                failed.set()
+                raise SpectrumDeviceNotConnected("mock card failure")
+            # the other cards are still running when the failing card raises
+            failed.wait(timeout=1.0)
+            sleep(0.05)
+            finished_cards.append(card)
+
+        with self.assertRaises(SpectrumDeviceNotConnected):
+            self._device._run_on_child_cards(wait_then_finish)
+        self.assertEqual(len(finished_cards), NUM_CARDS_IN_STAR_HUB - 1)
+
+    def test_child_card_threads_are_stopped_on_disconnect(self) -> None:
+        self.assertEqual([None] * NUM_CARDS_IN_STAR_HUB, self._device._run_on_child_cards(lambda card: None))
+        pool_threads = [
+            thread for thread in enumerate_threads() if thread.name.startswith(f"{self._device._visa_string}-")
+        ]
+        self.assertGreater(len(pool_threads), 0)
+        self._device.disconnect()
+        for thread in pool_threads:
+            thread.join(timeout=1.0)
+            self.assertFalse(thread.is_alive())
+        # the pool is created again if the hub is reconnected
+        self._device.reconnect()
+        self.assertEqual([None] * NUM_CARDS_IN_STAR_HUB, self._device._run_on_child_cards(lambda card: None))